@@ -7,12 +7,23 @@ Handles graceful shutdown via signals.
 import asyncio
 import logging
 import signal
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Set
+
+try:
+    import uvloop
+except ImportError:
+    # Optional: pip install pmkit[speed] (not available on Windows)
+    uvloop = None
 
 logger = logging.getLogger(__name__)
 
+# Use uvloop for every event loop created after pmkit is imported
+# (e.g. asyncio.run(bot.run())). Falls back to stock asyncio if missing.
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 
 class BaseBot(ABC):
     """
@@ -66,7 +77,9 @@ class BaseBot(ABC):
 
         self._running = False
         self._last_boundary: Optional[int] = None
-        self._tasks: list = []
+        self._next_boundary: Optional[int] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._stop_event = asyncio.Event()
 
     @property
     def mode(self) -> str:
@@ -75,14 +88,12 @@ class BaseBot(ABC):
 
     def _get_current_boundary(self) -> int:
         """Get current interval boundary timestamp."""
-        now = int(datetime.now(timezone.utc).timestamp())
-        return (now // self.rollover_interval) * self.rollover_interval
+        now = int(time.time())
+        return now - now % self.rollover_interval
 
     def _get_seconds_into_interval(self) -> int:
         """Get seconds since interval started."""
-        now = int(datetime.now(timezone.utc).timestamp())
-        boundary = self._get_current_boundary()
-        return now - boundary
+        return int(time.time()) % self.rollover_interval
 
     def _get_seconds_until_next_interval(self) -> int:
         """Get seconds until next interval."""
@@ -136,8 +147,13 @@ class BaseBot(ABC):
         Sets up signal handlers, initializes resources,
         runs main loop until stopped.
         """
-        # Set up signal handlers
         loop = asyncio.get_event_loop()
+
+        # Run new tasks eagerly until their first suspension (Python 3.12+)
+        if hasattr(asyncio, "eager_task_factory"):
+            loop.set_task_factory(asyncio.eager_task_factory)
+
+        # Set up signal handlers
         for sig in (signal.SIGINT, signal.SIGTERM):
             try:
                 loop.add_signal_handler(sig, self._signal_handler)
@@ -155,7 +171,15 @@ class BaseBot(ABC):
     def _signal_handler(self) -> None:
         """Handle shutdown signals."""
         logger.info("Shutdown signal received")
-        asyncio.create_task(self.stop())
+        # Wake the main loop; run() calls stop() once start() returns
+        self._stop_event.set()
+
+    async def _wait(self, delay: float) -> None:
+        """Sleep for delay seconds, returning early if a stop is requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
 
     async def start(self) -> None:
         """
@@ -173,17 +197,25 @@ class BaseBot(ABC):
 
         # Initialize boundary tracking
         self._last_boundary = self._get_current_boundary()
+        self._next_boundary = self._last_boundary + self.rollover_interval
+        self._stop_event.clear()
         self._running = True
 
         logger.info("Bot started. Press Ctrl+C to stop.")
 
+        # Ticks are scheduled against absolute deadlines on the loop's
+        # monotonic clock, so time spent in _tick() doesn't cause drift
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+
         # Main loop
-        while self._running:
+        while self._running and not self._stop_event.is_set():
             try:
-                # Check for rollover
-                current_boundary = self._get_current_boundary()
-                if current_boundary != self._last_boundary:
-                    self._last_boundary = current_boundary
+                # Check for rollover (one comparison against the cached boundary)
+                if time.time() >= self._next_boundary:
+                    # Recompute rather than += so a long stall fires only once
+                    self._last_boundary = self._get_current_boundary()
+                    self._next_boundary = self._last_boundary + self.rollover_interval
                     logger.info(f"Interval rollover detected")
                     await self._on_rollover()
 
@@ -191,13 +223,20 @@ class BaseBot(ABC):
                 await self._tick()
 
                 # Wait for next tick
-                await asyncio.sleep(self.tick_interval)
+                deadline += self.tick_interval
+                delay = deadline - loop.time()
+                if delay < 0:
+                    # Tick overran - resync instead of bursting to catch up
+                    deadline = loop.time()
+                    delay = 0.0
+                await self._wait(delay)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
-                await asyncio.sleep(1)  # Prevent tight error loop
+                await self._wait(1)  # Prevent tight error loop
+                deadline = loop.time()
 
     async def stop(self) -> None:
         """
@@ -210,14 +249,13 @@ class BaseBot(ABC):
 
         logger.info("Stopping bot...")
         self._running = False
+        self._stop_event.set()
 
-        # Cancel any background tasks
-        for task in self._tasks:
+        # Cancel any background tasks and wait for them concurrently
+        tasks = list(self._tasks)
+        for task in tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        await asyncio.gather(*tasks, return_exceptions=True)
         self._tasks.clear()
 
         # Run cleanup
@@ -231,6 +269,9 @@ class BaseBot(ABC):
         """
         Add a background task that will be cancelled on stop.
 
+        Finished tasks are dropped automatically, so long-running bots
+        can spawn short-lived tasks without growing the task set.
+
         Args:
             coro: Coroutine to run
 
@@ -238,5 +279,7 @@ class BaseBot(ABC):
             Task handle
         """
         task = asyncio.create_task(coro)
-        self._tasks.append(task)
+        if not task.done():
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
         return task
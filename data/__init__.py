@@ -1,5 +1,5 @@
 """Data module for pmkit."""
 
-from pmkit.data.storage import CSVStorage
+from pmkit.data.storage import CSVStorage, ParquetStorage
 
-__all__ = ["CSVStorage"]
+__all__ = ["CSVStorage", "ParquetStorage"]
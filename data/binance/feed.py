@@ -2,7 +2,7 @@
 
 Features:
 - Real-time 1s candle streaming
-- Rolling buffer for recent data
+- Rolling buffer for recent data (columnar NumPy ring)
 - Warmup initialization from REST API
 - Only emits closed candles
 
@@ -13,15 +13,21 @@ Usage:
 """
 
 import asyncio
-import json
+import inspect
 import logging
-from collections import deque
+import random
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import numpy as np
 import websockets
 from websockets.client import WebSocketClientProtocol
 
+try:
+    import orjson as json  # Optional: pip install pmkit[speed]
+except ImportError:
+    import json
+
 from pmkit.data.binance.types import Candle, Interval, get_symbol
 from pmkit.data.binance.fetcher import BinanceFetcher
 
@@ -37,6 +43,10 @@ class BinanceFeed:
     - Streaming: Real-time candles via WebSocket
     - Buffer: Rolling buffer for recent data access
     - Only closed candles: Wait for candle to close before emitting
+
+    The buffer is stored column-wise (int64 open times + float64 OHLCV)
+    in a ring that mirrors every row at i and i + buffer_size, so the
+    most recent n rows are always one contiguous slice.
     """
 
     WS_URL = "wss://stream.binance.com:9443/ws"
@@ -59,15 +69,24 @@ class BinanceFeed:
         self.interval = interval
         self.buffer_size = buffer_size
 
-        self._buffer: deque[Candle] = deque(maxlen=buffer_size)
+        # Ring buffer: each row is written at head and head + buffer_size
+        self._ts = np.zeros(2 * buffer_size, dtype=np.int64)  # open time (ms)
+        self._ohlcv = np.zeros((2 * buffer_size, 5), dtype=np.float64)
+        self._head = 0
+        self._count = 0
+
         self._running = False
         self._initialized = False
         self._task: Optional[asyncio.Task] = None
-        self._on_candle: Optional[Callable[[Candle], Any]] = None
+        self._on_candle: Optional[Callable[..., Any]] = None
+        self._materialize = True
+        self._on_candle_async = False
 
         # Reconnection settings
-        self._retry_delay = 1.0
+        self._base_retry_delay = 1.0
+        self._retry_delay = self._base_retry_delay
         self._max_retry_delay = 30.0
+        self._stable_connection_secs = 60.0  # Uptime after which backoff resets
 
     async def initialize(self, warmup_count: int = 1000) -> None:
         """
@@ -78,33 +97,48 @@ class BinanceFeed:
         """
         logger.info(f"Initializing {self.symbol} feed with {warmup_count} warmup candles...")
 
-        fetcher = BinanceFetcher()
-        candles = await fetcher.fetch_warmup(
-            symbol=self.symbol,
-            interval=self.interval,
-            count=warmup_count,
-        )
+        # Raw klines go straight into the buffer - no Candle/datetime round trip
+        async with BinanceFetcher() as fetcher:
+            klines = await fetcher.fetch_warmup_klines(
+                symbol=self.symbol,
+                interval=self.interval,
+                count=warmup_count,
+            )
 
-        for candle in candles:
-            self._buffer.append(candle)
+        for k in klines:
+            self._append(
+                k[0],
+                float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]),
+            )
 
         self._initialized = True
-        logger.info(f"Initialized with {len(self._buffer)} candles")
+        logger.info(f"Initialized with {self._count} candles")
 
-    async def start(self, on_candle: Optional[Callable[[Candle], Any]] = None) -> None:
+    async def start(
+        self,
+        on_candle: Optional[Callable[..., Any]] = None,
+        materialize: bool = True,
+    ) -> None:
         """
         Start the WebSocket stream.
 
         Args:
             on_candle: Callback for each closed candle
+            materialize: If True, on_candle receives a Candle. If False, it
+                receives a (timestamp_ms, open, high, low, close, volume)
+                tuple, skipping Candle/datetime construction per message.
         """
         if self._running:
             logger.warning(f"[{self.symbol}] Already running")
             return
 
         self._on_candle = on_candle
+        self._materialize = materialize
+        self._on_candle_async = inspect.iscoroutinefunction(on_candle) or (
+            on_candle is not None and inspect.iscoroutinefunction(getattr(on_candle, "__call__", None))
+        )
         self._running = True
-        self._retry_delay = 1.0
+        self._retry_delay = self._base_retry_delay
 
         self._task = asyncio.create_task(self._run())
         logger.info(f"[{self.symbol}] WebSocket stream started")
@@ -130,8 +164,10 @@ class BinanceFeed:
         """Main WebSocket connection loop."""
         stream_name = f"{self.symbol.lower()}@kline_{self.interval.value}"
         ws_url = f"{self.WS_URL}/{stream_name}"
+        loop = asyncio.get_running_loop()
 
         while self._running:
+            connected_at: Optional[float] = None
             try:
                 logger.info(f"[{self.symbol}] Connecting to {ws_url}...")
 
@@ -140,9 +176,11 @@ class BinanceFeed:
                     ping_interval=20,
                     ping_timeout=10,
                     close_timeout=5,
+                    compression=None,  # Small JSON frames - deflate costs more than it saves
+                    max_size=2**16,  # Kline frames are < 1 KB
                 ) as ws:
                     logger.info(f"[{self.symbol}] Connected")
-                    self._retry_delay = 1.0  # Reset on success
+                    connected_at = loop.time()
 
                     async for message in ws:
                         if not self._running:
@@ -151,26 +189,56 @@ class BinanceFeed:
 
             except websockets.ConnectionClosed as e:
                 if self._running:
+                    delay = self._next_retry_delay(connected_at)
                     logger.warning(
                         f"[{self.symbol}] Connection closed: {e.code}. "
-                        f"Reconnecting in {self._retry_delay:.1f}s..."
+                        f"Reconnecting in {delay:.1f}s..."
                     )
-                    await self._wait_and_backoff()
+                    await asyncio.sleep(delay)
 
             except Exception as e:
                 if self._running:
+                    delay = self._next_retry_delay(connected_at)
                     logger.error(
                         f"[{self.symbol}] Error: {e}. "
-                        f"Reconnecting in {self._retry_delay:.1f}s..."
+                        f"Reconnecting in {delay:.1f}s..."
+                    )
+                    await asyncio.sleep(delay)
+
+            else:
+                # Stream ended with a clean close - don't reconnect in a tight loop
+                if self._running:
+                    delay = self._next_retry_delay(connected_at)
+                    logger.warning(
+                        f"[{self.symbol}] Stream ended. "
+                        f"Reconnecting in {delay:.1f}s..."
                     )
-                    await self._wait_and_backoff()
+                    await asyncio.sleep(delay)
 
-    async def _wait_and_backoff(self) -> None:
-        """Wait with exponential backoff."""
-        await asyncio.sleep(self._retry_delay)
-        self._retry_delay = min(self._retry_delay * 2, self._max_retry_delay)
+    def _next_retry_delay(self, connected_at: Optional[float]) -> float:
+        """
+        Get the next reconnect delay (decorrelated jitter).
+
+        Backoff resets once a connection has stayed up for a while, so a
+        brief dropout reconnects quickly while a flapping one escalates.
+        Jitter keeps multiple feeds from reconnecting in lockstep.
 
-    async def _handle_message(self, message: str) -> None:
+        Args:
+            connected_at: loop.time() when the last connection opened, or None
+        """
+        if connected_at is not None:
+            uptime = asyncio.get_running_loop().time() - connected_at
+            if uptime >= self._stable_connection_secs:
+                self._retry_delay = self._base_retry_delay
+
+        delay = min(
+            self._max_retry_delay,
+            random.uniform(self._base_retry_delay, self._retry_delay * 3),
+        )
+        self._retry_delay = delay
+        return delay
+
+    async def _handle_message(self, message: Union[str, bytes]) -> None:
         """Handle incoming WebSocket message."""
         try:
             data = json.loads(message)
@@ -184,30 +252,80 @@ class BinanceFeed:
             if not kline.get("x", False):
                 return
 
-            # Parse candle
-            candle = Candle(
-                timestamp=datetime.fromtimestamp(kline["t"] / 1000, tz=timezone.utc),
-                open=float(kline["o"]),
-                high=float(kline["h"]),
-                low=float(kline["l"]),
-                close=float(kline["c"]),
-                volume=float(kline["v"]),
-                symbol=self.symbol,
-                interval=self.interval.value,
-            )
-
             # Add to buffer
-            self._buffer.append(candle)
-
-            # Call callback
-            if self._on_candle:
-                result = self._on_candle(candle)
-                if asyncio.iscoroutine(result):
-                    await result
+            row = (
+                kline["t"],
+                float(kline["o"]),
+                float(kline["h"]),
+                float(kline["l"]),
+                float(kline["c"]),
+                float(kline["v"]),
+            )
+            self._append(*row)
+
+            # Call callback (kind resolved once in start())
+            on_candle = self._on_candle
+            if on_candle is not None:
+                if self._materialize:
+                    row = self._candle_at(self._head + self.buffer_size - 1)
+                if self._on_candle_async:
+                    await on_candle(row)
+                else:
+                    result = on_candle(row)
+                    # Sync callables that hand back a coroutine (lambdas, wrappers)
+                    if result is not None and asyncio.iscoroutine(result):
+                        await result
 
         except Exception as e:
             logger.error(f"[{self.symbol}] Error handling message: {e}")
 
+    # === Buffer ===
+
+    def _append(
+        self,
+        ts_ms: int,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> None:
+        """Write a candle into the ring buffer."""
+        size = self.buffer_size
+        last = self._head + size - 1
+
+        if self._count and ts_ms == self._ts[last]:
+            # Same candle again (e.g. warmup's open candle, now closed) - replace
+            idx = last % size
+        else:
+            idx = self._head
+            self._head = (idx + 1) % size
+            self._count = min(self._count + 1, size)
+
+        row = (open, high, low, close, volume)
+        self._ts[idx] = self._ts[idx + size] = ts_ms
+        self._ohlcv[idx] = self._ohlcv[idx + size] = row
+
+    def _window(self, n: Optional[int] = None) -> slice:
+        """Get the contiguous slice holding the n most recent candles."""
+        count = self._count if n is None else max(0, min(n, self._count))
+        end = self._head + self.buffer_size
+        return slice(end - count, end)
+
+    def _candle_at(self, i: int) -> Candle:
+        """Build a Candle from buffer row i."""
+        o, h, l, c, v = self._ohlcv[i].tolist()
+        return Candle(
+            timestamp=datetime.fromtimestamp(int(self._ts[i]) / 1000, tz=timezone.utc),
+            open=o,
+            high=h,
+            low=l,
+            close=c,
+            volume=v,
+            symbol=self.symbol,
+            interval=self.interval.value,
+        )
+
     # === Data Access ===
 
     @property
@@ -223,18 +341,19 @@ class BinanceFeed:
     @property
     def candle_count(self) -> int:
         """Get number of candles in buffer."""
-        return len(self._buffer)
+        return self._count
 
     def get_latest(self) -> Optional[Candle]:
         """Get the most recent candle."""
-        if not self._buffer:
+        if not self._count:
             return None
-        return self._buffer[-1]
+        return self._candle_at(self._head + self.buffer_size - 1)
 
     def get_latest_price(self) -> Optional[float]:
         """Get the most recent close price."""
-        candle = self.get_latest()
-        return candle.close if candle else None
+        if not self._count:
+            return None
+        return float(self._ohlcv[self._head + self.buffer_size - 1, 3])
 
     def get_buffer(self, n: Optional[int] = None) -> List[Candle]:
         """
@@ -246,14 +365,8 @@ class BinanceFeed:
         Returns:
             List of candles (oldest first)
         """
-        if not self._buffer:
-            return []
-
-        candles = list(self._buffer)
-        if n is not None:
-            candles = candles[-n:]
-
-        return candles
+        window = self._window(n)
+        return [self._candle_at(i) for i in range(window.start, window.stop)]
 
     def get_buffer_df(self, n: Optional[int] = None):
         """
@@ -267,16 +380,17 @@ class BinanceFeed:
         """
         import pandas as pd
 
-        candles = self.get_buffer(n)
+        window = self._window(n)
+        ohlcv = self._ohlcv[window]
 
-        if not candles:
-            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
-
-        data = [c.to_ohlcv_dict() for c in candles]
-        df = pd.DataFrame(data)
-        df = df.sort_values("timestamp").reset_index(drop=True)
-
-        return df
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(self._ts[window], unit="ms", utc=True),
+            "open": ohlcv[:, 0],
+            "high": ohlcv[:, 1],
+            "low": ohlcv[:, 2],
+            "close": ohlcv[:, 3],
+            "volume": ohlcv[:, 4],
+        })
 
     def get_prices(self, n: int = 900) -> List[float]:
         """
@@ -288,5 +402,17 @@ class BinanceFeed:
         Returns:
             List of close prices (oldest first)
         """
-        candles = self.get_buffer(n)
-        return [c.close for c in candles]
+        return self._ohlcv[self._window(n), 3].tolist()
+
+    def get_prices_np(self, n: int = 900) -> np.ndarray:
+        """
+        Get recent close prices as a NumPy array.
+
+        Args:
+            n: Number of prices
+
+        Returns:
+            float64 array of close prices (oldest first). A copy, so later
+            buffer writes don't change it.
+        """
+        return self._ohlcv[self._window(n), 3].copy()
@@ -5,6 +5,7 @@ Features:
 - Warmup data fetching for live strategies
 - Interactive configuration via inquirer
 - Rate limiting
+- Concurrent warmup pagination
 
 Intervals: 1s, 1m, 5m, 15m
 Assets: BTC, ETH, SOL, XRP, ADA, LTC, BNB (extensible)
@@ -13,10 +14,12 @@ Assets: BTC, ETH, SOL, XRP, ADA, LTC, BNB (extensible)
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import httpx
+import numpy as np
 import pandas as pd
 
 from pmkit.data.binance.types import Candle, Interval, get_symbol
@@ -25,7 +28,44 @@ logger = logging.getLogger(__name__)
 
 BINANCE_API = "https://api.binance.com/api/v3/klines"
 MAX_LIMIT = 1000  # Binance max per request
-RATE_LIMIT_DELAY = 0.1  # seconds between requests
+MAX_CONCURRENT_REQUESTS = 10  # parallel warmup windows
+
+# Rate limiting (Binance request weight per IP)
+WEIGHT_LIMIT_PER_MIN = 1200
+KLINES_WEIGHT = 2  # weight of one klines request (limit <= 1000)
+WEIGHT_BACKOFF_RATIO = 0.9  # pause bursts once used weight reaches this share
+
+
+class _TokenBucket:
+    """Async token bucket for request-weight rate limiting."""
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, weight: float = 1) -> None:
+        """Wait until weight tokens are available, then consume them."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    elapsed = now - self._updated
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+                self._updated = now
+
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+
+                await asyncio.sleep((weight - self._tokens) / self.refill_per_sec)
+
+    def drain(self) -> None:
+        """Empty the bucket so subsequent requests wait for refill."""
+        self._tokens = 0.0
 
 
 class BinanceFetcher:
@@ -33,22 +73,26 @@ class BinanceFetcher:
     Fetcher for historical Binance OHLCV data.
 
     Usage:
-        fetcher = BinanceFetcher()
-
-        # Fetch historical data
-        df = await fetcher.fetch(
-            symbol="BTCUSDT",
-            interval=Interval.SECOND_1,
-            start=datetime(2024, 1, 1),
-            end=datetime(2024, 1, 2),
-        )
-
-        # Warmup fetch for live trading
-        candles = await fetcher.fetch_warmup(
-            symbol="BTCUSDT",
-            interval=Interval.SECOND_1,
-            count=1000,
-        )
+        async with BinanceFetcher() as fetcher:
+            # Fetch historical data
+            df = await fetcher.fetch(
+                symbol="BTCUSDT",
+                interval=Interval.SECOND_1,
+                start=datetime(2024, 1, 1),
+                end=datetime(2024, 1, 2),
+            )
+
+            # Warmup fetch for live trading
+            candles = await fetcher.fetch_warmup(
+                symbol="BTCUSDT",
+                interval=Interval.SECOND_1,
+                count=1000,
+            )
+
+    One HTTP/2 client is shared across calls (keep-alive, no per-call TLS
+    handshake) and stays open until close(). Use as an async context
+    manager, or call close() when done - a fetcher that is dropped without
+    either leaks its connection pool.
     """
 
     def __init__(self, timeout: float = 30.0):
@@ -59,6 +103,30 @@ class BinanceFetcher:
             timeout: HTTP request timeout in seconds.
         """
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        self._bucket = _TokenBucket(WEIGHT_LIMIT_PER_MIN, WEIGHT_LIMIT_PER_MIN / 60)
+
+    async def __aenter__(self) -> "BinanceFetcher":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=MAX_CONCURRENT_REQUESTS),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     async def fetch(
         self,
@@ -93,13 +161,13 @@ class BinanceFetcher:
 
         logger.info(f"Fetching {symbol} {interval.value} from {start} to {end}...")
 
-        all_klines = await self._fetch_klines(symbol, interval.value, start_ms, end_ms)
+        ts, ohlcv = await self._fetch_klines(symbol, interval, start_ms, end_ms)
 
-        if not all_klines:
+        if not len(ts):
             logger.warning(f"No data returned for {symbol}")
             return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
 
-        df = self._klines_to_dataframe(all_klines)
+        df = self._klines_to_dataframe(ts, ohlcv)
         logger.info(f"Fetched {len(df)} candles for {symbol}")
 
         return df
@@ -122,120 +190,173 @@ class BinanceFetcher:
             List of Candle objects (oldest first)
         """
         symbol = get_symbol(symbol)
+        klines = await self.fetch_warmup_klines(symbol, interval, count)
 
-        logger.info(f"Fetching {count} warmup candles for {symbol} {interval.value}...")
+        unique_candles = [
+            Candle.from_binance_kline(k, symbol=symbol, interval=interval.value)
+            for k in klines
+        ]
 
-        all_klines = []
-        remaining = count
-        end_time = None
+        logger.info(f"Fetched {len(unique_candles)} unique warmup candles for {symbol}")
+        return unique_candles
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while remaining > 0:
-                batch_size = min(remaining, MAX_LIMIT)
+    async def fetch_warmup_klines(
+        self,
+        symbol: str,
+        interval: Interval,
+        count: int = 1000,
+    ) -> List[list]:
+        """
+        Fetch recent raw klines for warmup, without building Candles.
 
-                params = {
-                    "symbol": symbol,
-                    "interval": interval.value,
-                    "limit": batch_size,
-                }
+        Use when the consumer works with integer open times and floats
+        (e.g. BinanceFeed's buffer) - skips two datetime conversions per row.
 
-                if end_time:
-                    params["endTime"] = end_time
+        Args:
+            symbol: Binance symbol or asset
+            interval: Candle interval
+            count: Number of candles to fetch
 
-                response = await client.get(BINANCE_API, params=params)
+        Returns:
+            Binance kline lists (oldest first, unique by open time)
+        """
+        symbol = get_symbol(symbol)
 
-                if response.status_code != 200:
-                    raise RuntimeError(f"Binance API error: {response.status_code} - {response.text}")
+        logger.info(f"Fetching {count} warmup candles for {symbol} {interval.value}...")
 
-                data = response.json()
+        # Fetch the latest batch first to anchor the windows on server time
+        params = {
+            "symbol": symbol,
+            "interval": interval.value,
+            "limit": min(count, MAX_LIMIT),
+        }
+        all_klines = await self._get_klines(params)
+
+        # Split the rest into non-overlapping endTime windows, fetched concurrently
+        remaining = count - len(all_klines)
+        if all_klines and remaining > 0:
+            window_ms = interval.seconds * 1000 * MAX_LIMIT
+            end_time = all_klines[0][0] - 1  # 1ms before oldest candle
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+            async def fetch_window(end_time: int, batch_size: int) -> list:
+                async with semaphore:
+                    return await self._get_klines({
+                        "symbol": symbol,
+                        "interval": interval.value,
+                        "limit": batch_size,
+                        "endTime": end_time,
+                    })
+
+            windows = []
+            while remaining > 0:
+                batch_size = min(remaining, MAX_LIMIT)
+                windows.append(fetch_window(end_time, batch_size))
+                end_time -= window_ms
+                remaining -= batch_size
 
-                if not data:
-                    break
+            batches = await asyncio.gather(*windows)
 
+            # Windows come back newest first, each ascending - stitch oldest
+            # first so the sort below only has to merge already-sorted runs
+            latest = all_klines
+            all_klines = []
+            for data in reversed(batches):
                 all_klines.extend(data)
+            all_klines.extend(latest)
 
-                # Set end_time for next batch (1ms before oldest candle)
-                end_time = data[0][0] - 1
-                remaining -= len(data)
-
-                logger.debug(f"Fetched {len(data)} candles, {remaining} remaining")
-                await asyncio.sleep(RATE_LIMIT_DELAY)
+            logger.debug(f"Fetched {len(all_klines)} candles in {len(batches) + 1} requests")
 
-        # Sort oldest first and convert to Candle objects
-        all_klines.sort(key=lambda x: x[0])
-
-        candles = [
-            Candle.from_binance_kline(k, symbol=symbol, interval=interval.value)
-            for k in all_klines
-        ]
+        # Sort oldest first and deduplicate by open_time
+        all_klines.sort(key=itemgetter(0))
 
-        # Deduplicate by timestamp
         seen = set()
-        unique_candles = []
-        for c in candles:
-            key = c.timestamp.isoformat()
-            if key not in seen:
-                seen.add(key)
-                unique_candles.append(c)
+        unique_klines = []
+        for k in all_klines:
+            if k[0] not in seen:
+                seen.add(k[0])
+                unique_klines.append(k)
 
-        logger.info(f"Fetched {len(unique_candles)} unique warmup candles for {symbol}")
-        return unique_candles
+        return unique_klines
 
     async def _fetch_klines(
         self,
         symbol: str,
-        interval: str,
+        interval: Interval,
         start_ms: int,
         end_ms: int,
-    ) -> list:
-        """Fetch all klines with pagination."""
-        all_klines = []
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch all klines with pagination.
+
+        Rows are written straight into preallocated arrays as pages arrive,
+        so the full history is never held as nested Python lists.
+
+        Returns:
+            (open times in ms as int64, OHLCV as float64 of shape (n, 5))
+        """
+        expected = (end_ms - start_ms) // (interval.seconds * 1000) + MAX_LIMIT
+        ts = np.empty(expected, dtype=np.int64)
+        ohlcv = np.empty((expected, 5), dtype=np.float64)
+        total = 0
         current_start = start_ms
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            while current_start < end_ms:
-                params = {
-                    "symbol": symbol,
-                    "interval": interval,
-                    "startTime": current_start,
-                    "endTime": end_ms,
-                    "limit": MAX_LIMIT,
-                }
+        while current_start < end_ms:
+            params = {
+                "symbol": symbol,
+                "interval": interval.value,
+                "startTime": current_start,
+                "endTime": end_ms,
+                "limit": MAX_LIMIT,
+            }
 
-                response = await client.get(BINANCE_API, params=params)
+            data = await self._get_klines(params)
 
-                if response.status_code != 200:
-                    raise RuntimeError(f"Binance API error: {response.status_code} - {response.text}")
+            if not data:
+                break
 
-                data = response.json()
+            n = len(data)
+            if total + n > len(ts):
+                # Estimate was short - grow geometrically
+                size = max(2 * len(ts), total + n)
+                ts = np.resize(ts, size)
+                ohlcv = np.resize(ohlcv, (size, 5))
 
-                if not data:
-                    break
+            ts[total:total + n] = [row[0] for row in data]
+            ohlcv[total:total + n] = [row[1:6] for row in data]
+            total += n
+            current_start = data[-1][0] + 1  # Next ms after last candle
 
-                all_klines.extend(data)
-                current_start = data[-1][0] + 1  # Next ms after last candle
+            logger.debug(f"Fetched {n} klines, total: {total}")
+
+        return ts[:total], ohlcv[:total]
 
-                logger.debug(f"Fetched {len(data)} klines, total: {len(all_klines)}")
-                await asyncio.sleep(RATE_LIMIT_DELAY)
+    async def _get_klines(self, params: dict) -> list:
+        """Request one page of klines (rate limited)."""
+        await self._bucket.acquire(KLINES_WEIGHT)
+        response = await self._get_client().get(BINANCE_API, params=params)
 
-        return all_klines
+        if response.status_code != 200:
+            raise RuntimeError(f"Binance API error: {response.status_code} - {response.text}")
 
-    def _klines_to_dataframe(self, klines: list) -> pd.DataFrame:
-        """Convert Binance klines to DataFrame."""
-        df = pd.DataFrame(klines, columns=[
-            "open_time", "open", "high", "low", "close", "volume",
-            "close_time", "quote_volume", "trades", "taker_buy_base",
-            "taker_buy_quote", "ignore"
-        ])
+        # Back off if the server reports we're close to the per-minute limit
+        used_weight = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used_weight and int(used_weight) >= WEIGHT_LIMIT_PER_MIN * WEIGHT_BACKOFF_RATIO:
+            logger.warning(f"Binance used weight {used_weight}/{WEIGHT_LIMIT_PER_MIN}, backing off")
+            self._bucket.drain()
 
-        df["timestamp"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-        df["open"] = df["open"].astype(float)
-        df["high"] = df["high"].astype(float)
-        df["low"] = df["low"].astype(float)
-        df["close"] = df["close"].astype(float)
-        df["volume"] = df["volume"].astype(float)
+        return response.json()
 
-        return df[["timestamp", "open", "high", "low", "close", "volume"]]
+    def _klines_to_dataframe(self, ts: np.ndarray, ohlcv: np.ndarray) -> pd.DataFrame:
+        """Convert kline arrays to DataFrame."""
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(ts, unit="ms", utc=True),
+            "open": ohlcv[:, 0],
+            "high": ohlcv[:, 1],
+            "low": ohlcv[:, 2],
+            "close": ohlcv[:, 3],
+            "volume": ohlcv[:, 4],
+        })
 
 
 async def interactive_fetch():
@@ -308,22 +429,22 @@ async def interactive_fetch():
         start = end - timedelta(days=days)
 
     # Fetch data
-    fetcher = BinanceFetcher()
     interval = Interval(answers["interval"])
     output_dir = Path(answers["output_dir"])
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    for asset in answers["assets"]:
-        symbol = get_symbol(asset)
-        logger.info(f"Fetching {symbol}...")
+    async with BinanceFetcher() as fetcher:
+        for asset in answers["assets"]:
+            symbol = get_symbol(asset)
+            logger.info(f"Fetching {symbol}...")
 
-        df = await fetcher.fetch(symbol, interval, start, end)
+            df = await fetcher.fetch(symbol, interval, start, end)
 
-        if not df.empty:
-            filename = f"{asset}_{interval.value}_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.csv"
-            filepath = output_dir / filename
-            df.to_csv(filepath, index=False)
-            logger.info(f"Saved {len(df)} candles to {filepath}")
+            if not df.empty:
+                filename = f"{asset}_{interval.value}_{start.strftime('%Y%m%d')}_{end.strftime('%Y%m%d')}.csv"
+                filepath = output_dir / filename
+                df.to_csv(filepath, index=False)
+                logger.info(f"Saved {len(df)} candles to {filepath}")
 
 
 if __name__ == "__main__":
@@ -6,7 +6,20 @@ Pure OHLCV data structures - no labels, no features.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
+
+# Interval value -> duration in seconds
+_INTERVAL_SECONDS = {
+    "1s": 1,
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
 
 
 class Interval(Enum):
@@ -24,20 +37,10 @@ class Interval(Enum):
     @property
     def seconds(self) -> int:
         """Get interval duration in seconds."""
-        mapping = {
-            "1s": 1,
-            "1m": 60,
-            "5m": 300,
-            "15m": 900,
-            "30m": 1800,
-            "1h": 3600,
-            "4h": 14400,
-            "1d": 86400,
-        }
-        return mapping[self.value]
+        return _INTERVAL_SECONDS[self.value]
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     """
     OHLCV candle data.
@@ -98,6 +101,35 @@ class Candle:
             taker_buy_quote=float(kline[10]),
         )
 
+    @classmethod
+    def from_binance_klines_batch(cls, klines: List[list]):
+        """
+        Convert raw Binance klines straight to an OHLCV DataFrame.
+
+        Builds columns with NumPy instead of one Candle per row - use for
+        bulk ingestion (same kline format as from_binance_kline).
+
+        Returns:
+            DataFrame with columns: timestamp (UTC), open, high, low, close, volume
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not klines:
+            return pd.DataFrame(columns=["timestamp", "open", "high", "low", "close", "volume"])
+
+        arr = np.array([k[:6] for k in klines], dtype=object)
+        ohlcv = arr[:, 1:6].astype(np.float64)
+
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms", utc=True),
+            "open": ohlcv[:, 0],
+            "high": ohlcv[:, 1],
+            "low": ohlcv[:, 2],
+            "close": ohlcv[:, 3],
+            "volume": ohlcv[:, 4],
+        })
+
     def to_dict(self) -> dict:
         """Convert to dictionary for CSV/DataFrame."""
         return {
@@ -135,10 +167,13 @@ SYMBOLS = {
 }
 
 
+@lru_cache(maxsize=256)
 def get_symbol(asset: str) -> str:
     """
     Get Binance symbol for an asset.
 
+    Results are cached - call get_symbol.cache_clear() after editing SYMBOLS.
+
     Args:
         asset: Asset name (e.g., "BTC", "ETH")
 
@@ -1,22 +1,101 @@
-"""CSV storage for OHLCV data.
+"""CSV and Parquet storage for OHLCV data.
 
 Features:
 - Pure OHLCV storage (no labels, no features)
 - Append mode for live data accumulation
 - Simple CSV format for human readability
+- Parquet format for compact archives (optional, needs pyarrow)
 """
 
+import atexit
 import logging
+import time
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import IO, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    # Optional: pip install pmkit[arrow]
+    pa = None
+
 from pmkit.data.binance.types import Candle
 
 logger = logging.getLogger(__name__)
 
+COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+
+# Candle -> (timestamp, open, high, low, close, volume) tuple
+_candle_row = attrgetter(*COLUMNS)
+
+
+def _to_dataframe(data: Union[pd.DataFrame, List[Candle], List[list]]) -> pd.DataFrame:
+    """Convert Candles / raw klines / DataFrame to an OHLCV DataFrame."""
+    if isinstance(data, list) and data and isinstance(data[0], Candle):
+        df = pd.DataFrame.from_records(map(_candle_row, data), columns=COLUMNS)
+    elif isinstance(data, list) and data and isinstance(data[0], (list, tuple)):
+        df = Candle.from_binance_klines_batch(data)
+    elif isinstance(data, pd.DataFrame):
+        df = data
+    else:
+        raise ValueError("data must be DataFrame, List[Candle] or List[list] of klines")
+
+    # Ensure columns
+    return df[COLUMNS]
+
+
+def _columns_to_dataframe(
+    timestamps: np.ndarray,
+    open: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> pd.DataFrame:
+    """Build an OHLCV DataFrame from column arrays (int64 ms or datetime64 timestamps)."""
+    timestamps = np.asarray(timestamps)
+    if np.issubdtype(timestamps.dtype, np.integer):
+        timestamps = pd.to_datetime(timestamps, unit="ms", utc=True)
+
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "open": open,
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    })
+
+
+def _select_range(
+    df: pd.DataFrame,
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> pd.DataFrame:
+    """Filter a loaded OHLCV DataFrame by time, then sort and deduplicate."""
+    # Filter by time range
+    if start is not None:
+        df = df[df["timestamp"] >= start]
+    if end is not None:
+        df = df[df["timestamp"] <= end]
+
+    # Sort and deduplicate - files are append-only, so usually already sorted
+    if not df["timestamp"].is_monotonic_increasing:
+        df = df.sort_values("timestamp", kind="stable")
+
+    duplicated = df["timestamp"].duplicated(keep="first").to_numpy()
+    if duplicated.any():
+        df = df[~duplicated]
+
+    return df.reset_index(drop=True)
+
 
 class CSVStorage:
     """
@@ -28,46 +107,90 @@ class CSVStorage:
         # Save candles
         storage.save(candles)
 
+        # Save column arrays (e.g. int64 ms timestamps + float64 OHLCV)
+        storage.save_columns(ts, o, h, l, c, v)
+
         # Load data
         df = storage.load()
 
         # Append single candle (for live trading)
         storage.append(candle)
+
+        # High-frequency appends: keep the file open, flush periodically
+        storage = CSVStorage(path, buffered=True, flush_interval=5.0)
     """
 
-    COLUMNS = ["timestamp", "open", "high", "low", "close", "volume"]
+    COLUMNS = COLUMNS
 
-    def __init__(self, path: Union[str, Path]):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        buffered: bool = False,
+        flush_interval: float = 5.0,
+    ):
         """
         Initialize storage.
 
         Args:
             path: Path to CSV file
+            buffered: If True, append() writes through one persistent file
+                handle with a 64 KB buffer instead of open/close per row
+            flush_interval: In buffered mode, append() flushes on the first
+                call at least this many seconds after the last flush. There
+                is no timer: once appends stop, rows stay buffered until the
+                next append(), flush() or close() (this instance's own
+                reads flush first; other processes see them only then)
         """
         self.path = Path(path)
+        self.buffered = buffered
+        self.flush_interval = flush_interval
+        self._has_header = False  # Cached once the file is known to have a header
+
+        self._fh: Optional[IO[str]] = None
+        self._last_flush = 0.0
 
     def save(
         self,
-        data: Union[pd.DataFrame, List[Candle]],
+        data: Union[pd.DataFrame, List[Candle], List[list]],
         append: bool = False,
     ) -> None:
         """
         Save data to CSV.
 
         Args:
-            data: DataFrame or list of Candle objects
+            data: DataFrame, list of Candle objects, or raw Binance klines
             append: If True, append to existing file
         """
-        # Convert Candles to DataFrame if needed
-        if isinstance(data, list) and data and isinstance(data[0], Candle):
-            df = pd.DataFrame([c.to_ohlcv_dict() for c in data])
-        elif isinstance(data, pd.DataFrame):
-            df = data
-        else:
-            raise ValueError("data must be DataFrame or List[Candle]")
+        self._write(_to_dataframe(data), append)
 
-        # Ensure columns
-        df = df[self.COLUMNS]
+    def save_columns(
+        self,
+        timestamps: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        append: bool = False,
+    ) -> None:
+        """
+        Save OHLCV column arrays to CSV without building Candle objects.
+
+        Args:
+            timestamps: Open times as int64 ms (Binance) or datetime64
+            open: Open prices
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+            append: If True, append to existing file
+        """
+        self._write(_columns_to_dataframe(timestamps, open, high, low, close, volume), append)
+
+    def _write(self, df: pd.DataFrame, append: bool) -> None:
+        """Write an OHLCV DataFrame (already in COLUMNS order) to CSV."""
+        # Buffered rows must land before pandas opens the file
+        self.flush()
 
         # Create directory if needed
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -77,6 +200,7 @@ class CSVStorage:
         header = not (append and self.path.exists())
 
         df.to_csv(self.path, mode=mode, header=header, index=False)
+        self._has_header = True
 
         logger.debug(f"Saved {len(df)} rows to {self.path} (append={append})")
 
@@ -84,10 +208,53 @@ class CSVStorage:
         """
         Append a single candle to the file.
 
+        Writes the CSV line directly (same format as save()) - building a
+        DataFrame costs far more than the write for a single row.
+
         Args:
             candle: Candle to append
         """
-        self.save([candle], append=True)
+        if not self._has_header:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._has_header = self.path.exists() and self.path.stat().st_size > 0
+
+        line = (
+            f"{candle.timestamp},{candle.open},{candle.high},"
+            f"{candle.low},{candle.close},{candle.volume}\n"
+        )
+        if not self._has_header:
+            line = ",".join(self.COLUMNS) + "\n" + line
+            self._has_header = True
+
+        if not self.buffered:
+            with open(self.path, "a") as f:
+                f.write(line)
+            return
+
+        if self._fh is None:
+            self._fh = open(self.path, "a", buffering=1 << 16)
+            self._last_flush = time.monotonic()
+            atexit.register(self.close)
+
+        self._fh.write(line)
+
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._fh.flush()
+            self._last_flush = now
+
+    def flush(self) -> None:
+        """Flush buffered appends to disk (no-op when unbuffered)."""
+        if self._fh is not None:
+            self._fh.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close the buffered file handle, if open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            atexit.unregister(self.close)
 
     def load(
         self,
@@ -104,46 +271,71 @@ class CSVStorage:
         Returns:
             DataFrame with OHLCV columns
         """
+        self.flush()
+
         if not self.path.exists():
             logger.warning(f"File not found: {self.path}")
             return pd.DataFrame(columns=self.COLUMNS)
 
-        df = pd.read_csv(self.path)
-
-        # Parse timestamp
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+        if pa is not None:
+            df = self._read_csv_arrow()
+        else:
+            # Declared schema skips per-column type inference
+            df = pd.read_csv(
+                self.path,
+                usecols=self.COLUMNS,
+                dtype={col: np.float64 for col in self.COLUMNS[1:]},
+            )
 
-        # Filter by time range
-        if start is not None:
-            df = df[df["timestamp"] >= start]
-        if end is not None:
-            df = df[df["timestamp"] <= end]
+        # Parse timestamp (no-op if Arrow already parsed it)
+        df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", utc=True, cache=True)
 
-        # Sort and deduplicate
-        df = df.sort_values("timestamp").drop_duplicates(subset=["timestamp"])
-        df = df.reset_index(drop=True)
+        df = _select_range(df, start, end)
 
         logger.debug(f"Loaded {len(df)} rows from {self.path}")
 
         return df
 
+    def _read_csv_arrow(self) -> pd.DataFrame:
+        """Read the CSV with Arrow's multithreaded parser."""
+        # OHLCV columns are declared; timestamp type is inferred so both
+        # tz-aware and naive timestamps parse without a string detour
+        table = pa_csv.read_csv(
+            str(self.path),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={col: pa.float64() for col in self.COLUMNS[1:]},
+                include_columns=self.COLUMNS,
+            ),
+        )
+        return table.to_pandas()
+
     def get_latest_timestamp(self) -> Optional[datetime]:
         """
         Get the timestamp of the most recent candle.
 
+        Reads only the tail of the file - rows are appended in time order,
+        so the last row holds the latest timestamp.
+
         Returns:
             Latest timestamp, or None if file is empty
         """
+        self.flush()
+
         if not self.path.exists():
             return None
 
-        df = pd.read_csv(self.path)
+        with open(self.path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - 4096))
+            lines = [line for line in f.read().splitlines() if line.strip()]
 
-        if df.empty:
+        # Nothing but (at most) the header
+        if not lines or (size <= 4096 and len(lines) < 2):
             return None
 
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
-        return df["timestamp"].max()
+        ts_str = lines[-1].split(b",", 1)[0].decode()
+        return pd.to_datetime(ts_str, format="ISO8601", utc=True)
 
     def exists(self) -> bool:
         """Check if the CSV file exists."""
@@ -151,9 +343,171 @@ class CSVStorage:
 
     def count(self) -> int:
         """Get number of rows in the file."""
+        self.flush()
+
+        if not self.path.exists():
+            return 0
+
+        # Count newlines in 1 MB binary blocks (bytes.count runs in C)
+        lines = 0
+        last = b""
+        with open(self.path, "rb") as f:
+            while chunk := f.read(1 << 20):
+                lines += chunk.count(b"\n")
+                last = chunk
+
+        # Final line without a trailing newline still counts
+        if last and not last.endswith(b"\n"):
+            lines += 1
+
+        # Exclude header
+        return max(lines - 1, 0)
+
+
+class ParquetStorage:
+    """
+    Parquet storage for OHLCV archives.
+
+    Same interface as CSVStorage, stored columnar and Snappy-compressed:
+    files are several times smaller and load without text parsing.
+    Requires pyarrow (pip install pmkit[arrow]).
+
+    Parquet files can't be appended in place - append rewrites the file,
+    so keep CSVStorage for per-candle live appends.
+
+    Usage:
+        storage = ParquetStorage(Path("data/btc_1s.parquet"))
+        storage.save(candles)
+        df = storage.load()
+    """
+
+    COLUMNS = COLUMNS
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize storage.
+
+        Args:
+            path: Path to Parquet file
+        """
+        if pa is None:
+            raise ImportError("ParquetStorage requires pyarrow: pip install pmkit[arrow]")
+        self.path = Path(path)
+
+    def save(
+        self,
+        data: Union[pd.DataFrame, List[Candle], List[list]],
+        append: bool = False,
+    ) -> None:
+        """
+        Save data to Parquet.
+
+        Args:
+            data: DataFrame, list of Candle objects, or raw Binance klines
+            append: If True, add to existing rows (rewrites the file)
+        """
+        self._write(_to_dataframe(data), append)
+
+    def save_columns(
+        self,
+        timestamps: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        append: bool = False,
+    ) -> None:
+        """
+        Save OHLCV column arrays to Parquet without building Candle objects.
+
+        Args:
+            timestamps: Open times as int64 ms (Binance) or datetime64
+            open: Open prices
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+            append: If True, add to existing rows (rewrites the file)
+        """
+        self._write(_columns_to_dataframe(timestamps, open, high, low, close, volume), append)
+
+    def _write(self, df: pd.DataFrame, append: bool) -> None:
+        """Write an OHLCV DataFrame (already in COLUMNS order) to Parquet."""
+        # Parquet needs one timestamp type - normalize to UTC
+        df = df.assign(timestamp=pd.to_datetime(df["timestamp"], utc=True))
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if append and self.path.exists():
+            df = pd.concat([self._read(), df], ignore_index=True)
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, self.path, compression="snappy")
+
+        logger.debug(f"Saved {len(df)} rows to {self.path} (append={append})")
+
+    def append(self, candle: Candle) -> None:
+        """
+        Append a single candle (rewrites the file).
+
+        Args:
+            candle: Candle to append
+        """
+        self.save([candle], append=True)
+
+    def _read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Read the file (memory-mapped) into a DataFrame."""
+        return pq.read_table(self.path, columns=columns, memory_map=True).to_pandas()
+
+    def load(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Load data from Parquet.
+
+        Args:
+            start: Filter from this datetime
+            end: Filter to this datetime
+
+        Returns:
+            DataFrame with OHLCV columns
+        """
+        if not self.path.exists():
+            logger.warning(f"File not found: {self.path}")
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        df = _select_range(self._read(), start, end)
+
+        logger.debug(f"Loaded {len(df)} rows from {self.path}")
+
+        return df
+
+    def get_latest_timestamp(self) -> Optional[datetime]:
+        """
+        Get the timestamp of the most recent candle.
+
+        Returns:
+            Latest timestamp, or None if file is empty
+        """
+        if not self.path.exists():
+            return None
+
+        timestamps = self._read(columns=["timestamp"])["timestamp"]
+        if timestamps.empty:
+            return None
+
+        return timestamps.max()
+
+    def exists(self) -> bool:
+        """Check if the Parquet file exists."""
+        return self.path.exists()
+
+    def count(self) -> int:
+        """Get number of rows in the file (from Parquet metadata)."""
         if not self.path.exists():
             return 0
 
-        # Count lines (excluding header)
-        with open(self.path) as f:
-            return sum(1 for _ in f) - 1
+        return pq.ParquetFile(self.path).metadata.num_rows
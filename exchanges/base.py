@@ -99,7 +99,7 @@ class Market:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Orderbook:
     """Orderbook snapshot."""
     token_id: str
@@ -3,8 +3,10 @@
 RSA-PSS signing for API requests.
 """
 
-import base64
+import binascii
+import os
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Union
 
@@ -12,18 +14,35 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
+# Signing parameters are immutable - build them once, not per request
+_SHA256 = hashes.SHA256()
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.DIGEST_LENGTH,
+)
+
 
 def load_private_key(key_path: Union[str, Path]):
     """
     Load RSA private key from PEM file.
 
+    Parsed keys are cached per (path, mtime), so the client and WebSocket
+    sharing one key file parse it once; editing the file reloads it.
+
     Args:
         key_path: Path to PEM file
 
     Returns:
         Private key object
     """
-    with open(key_path, "rb") as f:
+    path = os.path.abspath(key_path)
+    return _load_private_key_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_private_key_cached(path: str, mtime_ns: int):
+    """Parse a PEM private key (cached by load_private_key)."""
+    with open(path, "rb") as f:
         return load_pem_private_key(f.read(), password=None)
 
 
@@ -38,16 +57,8 @@ def sign_pss_text(private_key, text: str) -> str:
     Returns:
         Base64 encoded signature
     """
-    message = text.encode("utf-8")
-    signature = private_key.sign(
-        message,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()),
-            salt_length=padding.PSS.DIGEST_LENGTH,
-        ),
-        hashes.SHA256(),
-    )
-    return base64.b64encode(signature).decode("utf-8")
+    signature = private_key.sign(text.encode("utf-8"), _PSS_PADDING, _SHA256)
+    return binascii.b2a_base64(signature, newline=False).decode("ascii")
 
 
 def get_auth_headers(
@@ -68,13 +79,13 @@ def get_auth_headers(
     Returns:
         Dict of authentication headers
     """
-    timestamp_ms = int(time.time() * 1000)
+    timestamp_ms = time.time_ns() // 1_000_000
     timestamp_str = str(timestamp_ms)
 
     # Message to sign: timestamp + method + full path
-    path_without_query = path.split("?")[0]
-    full_path = "/trade-api/v2" + path_without_query
-    msg_string = timestamp_str + method + full_path
+    query_start = path.find("?")
+    path_without_query = path if query_start < 0 else path[:query_start]
+    msg_string = f"{timestamp_str}{method}/trade-api/v2{path_without_query}"
     signature = sign_pss_text(private_key, msg_string)
 
     return {
@@ -96,11 +107,10 @@ def get_ws_auth_headers(api_key_id: str, private_key) -> Dict[str, str]:
     Returns:
         Dict of authentication headers
     """
-    timestamp_ms = int(time.time() * 1000)
+    timestamp_ms = time.time_ns() // 1_000_000
     timestamp_str = str(timestamp_ms)
 
-    path = "/trade-api/ws/v2"
-    msg_string = timestamp_str + "GET" + path
+    msg_string = f"{timestamp_str}GET/trade-api/ws/v2"
     signature = sign_pss_text(private_key, msg_string)
 
     return {
@@ -3,13 +3,26 @@
 Building blocks for trading on Kalshi prediction markets.
 """
 
+import asyncio
 import logging
+import time
+from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 import httpx
 
+try:
+    import orjson as json  # Optional: pip install pmkit[speed]
+
+    _dumps = json.dumps
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 from pmkit.exchanges.base import (
     BaseExchange,
     Orderbook,
@@ -21,9 +34,20 @@ from pmkit.exchanges.base import (
 )
 from pmkit.exchanges.kalshi.auth import get_auth_headers, load_private_key
 from pmkit.exchanges.kalshi.types import API_BASE
+from pmkit.exchanges.utils import parse_timestamp, single_flight
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_CANCELS = 20  # in-flight DELETEs per cancel_orders() call
+
+# Kalshi order status -> OrderStatus
+_STATUS_MAP = {
+    "resting": OrderStatus.OPEN,
+    "executed": OrderStatus.FILLED,
+    "canceled": OrderStatus.CANCELLED,
+    "pending": OrderStatus.PENDING,
+}
+
 
 class KalshiExchange(BaseExchange):
     """
@@ -51,6 +75,7 @@ class KalshiExchange(BaseExchange):
         self,
         api_key_id: str,
         private_key_path: Union[str, Path],
+        signature_ttl: float = 0.0,
     ):
         """
         Initialize Kalshi client.
@@ -58,15 +83,23 @@ class KalshiExchange(BaseExchange):
         Args:
             api_key_id: Kalshi API key ID
             private_key_path: Path to RSA private key PEM file
+            signature_ttl: Seconds to reuse signed headers per GET path.
+                0 signs every request. Small values (e.g. 1.0) cut RSA-PSS
+                signing for high-rate pollers; keep well inside Kalshi's
+                timestamp tolerance. State-changing calls (order POSTs,
+                cancel DELETEs) are always signed fresh.
         """
         self.api_key_id = api_key_id
         self.private_key_path = Path(private_key_path)
+        self.signature_ttl = signature_ttl
         self._private_key = None
+        self._header_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, str]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
         self._client: Optional[httpx.AsyncClient] = None
         self._initialized = False
 
         logger.info("Kalshi client initializing...")
-        logger.info(f"  API Key: {api_key_id[:8]}...")
+        logger.info("  API Key: %s...", api_key_id[:8])
 
     # === Connection ===
 
@@ -77,12 +110,17 @@ class KalshiExchange(BaseExchange):
 
         try:
             self._private_key = load_private_key(self.private_key_path)
-            self._client = httpx.AsyncClient(timeout=30.0)
+            # HTTP/2 lets concurrent requests (e.g. get_orderbooks) share one connection
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=50),
+            )
             self._initialized = True
             logger.info("Kalshi client connected")
 
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             raise
 
     async def disconnect(self) -> None:
@@ -91,6 +129,7 @@ class KalshiExchange(BaseExchange):
             await self._client.aclose()
             self._client = None
         self._private_key = None
+        self._header_cache.clear()
         self._initialized = False
         logger.info("Kalshi client disconnected")
 
@@ -101,7 +140,44 @@ class KalshiExchange(BaseExchange):
 
     def _get_headers(self, method: str, path: str) -> Dict[str, str]:
         """Get authentication headers for a request."""
-        return get_auth_headers(self.api_key_id, self._private_key, method, path)
+        # Only read-only GETs may reuse a signature - never replay one on
+        # an order placement or cancel
+        if self.signature_ttl <= 0 or method != "GET":
+            return get_auth_headers(self.api_key_id, self._private_key, method, path)
+
+        # Reuse a recent signature for the same request shape
+        key = (method, path)
+        now = time.monotonic()
+        cached = self._header_cache.get(key)
+        if cached and now - cached[0] < self.signature_ttl:
+            return cached[1]
+
+        # Paths include order IDs - drop expired entries so the cache stays small
+        if len(self._header_cache) >= 256:
+            self._header_cache = {
+                k: v for k, v in self._header_cache.items()
+                if now - v[0] < self.signature_ttl
+            }
+
+        headers = get_auth_headers(self.api_key_id, self._private_key, method, path)
+        self._header_cache[key] = (now, headers)
+        return headers
+
+    async def _get_json_shared(self, path: str) -> Dict:
+        """
+        GET a path and decode the JSON body, sharing in-flight requests.
+
+        Concurrent callers for the same path await one request instead of
+        each sending their own. The result is shared - don't mutate it.
+        """
+        return await single_flight(self._inflight, path, lambda: self._get_json(path))
+
+    async def _get_json(self, path: str) -> Dict:
+        """GET a path and decode the JSON body."""
+        headers = self._get_headers("GET", path)
+        resp = await self._client.get(f"{API_BASE}{path}", headers=headers)
+        resp.raise_for_status()
+        return json.loads(resp.content)
 
     # === Orders ===
 
@@ -135,34 +211,31 @@ class KalshiExchange(BaseExchange):
         # Map side to Kalshi terminology
         kalshi_side = "yes" if side == OrderSide.BUY else "no"
 
-        body = {
+        # Price field is named after the side (yes_price / no_price)
+        body = _dumps({
             "ticker": token_id,
             "side": kalshi_side,
             "action": "buy",
             "type": "limit",
             "count": int(size),
-        }
-
-        # Set price based on side
-        if kalshi_side == "yes":
-            body["yes_price"] = price_cents
-        else:
-            body["no_price"] = price_cents
+            f"{kalshi_side}_price": price_cents,
+        })
 
         headers = self._get_headers("POST", path)
 
-        logger.info(f"Placing Kalshi order: {token_id} {kalshi_side} @ {price_cents}c x{int(size)}")
+        logger.info("Placing Kalshi order: %s %s @ %dc x%d", token_id, kalshi_side, price_cents, size)
 
         try:
-            resp = await self._client.post(url, headers=headers, json=body)
+            # Pre-encoded body; auth headers already carry Content-Type
+            resp = await self._client.post(url, headers=headers, content=body)
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
 
             order = data.get("order", {})
             order_id = order.get("order_id", "")
             status = self._parse_order_status(order.get("status", ""))
 
-            logger.info(f"Kalshi order placed: {order_id}")
+            logger.info("Kalshi order placed: %s", order_id)
 
             return OrderResult(
                 order_id=order_id,
@@ -171,14 +244,14 @@ class KalshiExchange(BaseExchange):
             )
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Order failed: {e.response.status_code} - {e.response.text}")
+            logger.error("Order failed: %s - %s", e.response.status_code, e.response.text)
             return OrderResult(
                 order_id="",
                 status=OrderStatus.REJECTED,
                 message=e.response.text,
             )
         except Exception as e:
-            logger.error(f"Order error: {e}")
+            logger.error("Order error: %s", e)
             return OrderResult(
                 order_id="",
                 status=OrderStatus.REJECTED,
@@ -225,21 +298,42 @@ class KalshiExchange(BaseExchange):
         url = f"{API_BASE}{path}"
         headers = self._get_headers("DELETE", path)
 
-        logger.info(f"Cancelling Kalshi order: {order_id}")
+        logger.info("Cancelling Kalshi order: %s", order_id)
 
         try:
             resp = await self._client.delete(url, headers=headers)
             resp.raise_for_status()
-            logger.info(f"Order cancelled: {order_id}")
+            logger.info("Order cancelled: %s", order_id)
             return True
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"Cancel failed: {e.response.status_code}")
+            logger.error("Cancel failed: %s", e.response.status_code)
             return False
         except Exception as e:
-            logger.error(f"Cancel error: {e}")
+            logger.error("Cancel error: %s", e)
             return False
 
+    async def cancel_orders(self, order_ids: List[str]) -> List[bool]:
+        """
+        Cancel several orders concurrently.
+
+        Kalshi cancels one order per request; these run in parallel over
+        the shared connection, at most MAX_CONCURRENT_CANCELS at a time.
+
+        Args:
+            order_ids: Order IDs to cancel
+
+        Returns:
+            Per-order success flags, in input order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_CANCELS)
+
+        async def cancel_one(order_id: str) -> bool:
+            async with semaphore:
+                return await self.cancel_order(order_id)
+
+        return list(await asyncio.gather(*(cancel_one(o) for o in order_ids)))
+
     async def get_order_status(self, order_id: str) -> Optional[OrderResult]:
         """
         Get order status.
@@ -259,20 +353,20 @@ class KalshiExchange(BaseExchange):
         try:
             resp = await self._client.get(url, headers=headers)
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
             order = data.get("order", {})
 
             return OrderResult(
                 order_id=order_id,
                 status=self._parse_order_status(order.get("status", "")),
-                filled_size=float(order.get("fill_count", 0)),
+                filled_size=float(order.get("fill_count") or 0),
                 raw_response=order,
             )
 
         except httpx.HTTPStatusError:
             return None
         except Exception as e:
-            logger.error(f"Get order error: {e}")
+            logger.error("Get order error: %s", e)
             return None
 
     async def get_open_orders(self) -> List[OrderResult]:
@@ -286,40 +380,59 @@ class KalshiExchange(BaseExchange):
         try:
             resp = await self._client.get(url, headers=headers, params={"status": "resting"})
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
             orders = data.get("orders", [])
 
-            results = []
-            for order in orders:
-                results.append(
-                    OrderResult(
-                        order_id=order.get("order_id", ""),
-                        status=self._parse_order_status(order.get("status", "")),
-                        filled_size=float(order.get("fill_count", 0)),
-                        raw_response=order,
-                    )
-                )
-
-            return results
+            return [self._parse_order(order) for order in orders]
 
         except Exception as e:
-            logger.error(f"Get open orders error: {e}")
+            logger.error("Get open orders error: %s", e)
             return []
 
+    async def iter_open_orders(self, page_size: int = 100) -> AsyncIterator[OrderResult]:
+        """
+        Iterate all open orders, following pagination.
+
+        Holds one page in memory at a time; stop iterating to skip the
+        remaining pages.
+
+        Args:
+            page_size: Orders per request
+        """
+        self._ensure_connected()
+
+        params = {"status": "resting", "limit": page_size}
+        try:
+            async for order in self._iter_pages("/portfolio/orders", "orders", params):
+                yield self._parse_order(order)
+        except Exception as e:
+            logger.error("Get open orders error: %s", e)
+
+    def _parse_order(self, order: Dict) -> OrderResult:
+        """Convert an API order to OrderResult."""
+        return OrderResult(
+            order_id=order.get("order_id", ""),
+            status=self._parse_order_status(order.get("status", "")),
+            filled_size=float(order.get("fill_count") or 0),
+            raw_response=order,
+        )
+
     def _parse_order_status(self, status: str) -> OrderStatus:
         """Parse API order status to OrderStatus enum."""
-        status_map = {
-            "resting": OrderStatus.OPEN,
-            "executed": OrderStatus.FILLED,
-            "canceled": OrderStatus.CANCELLED,
-            "pending": OrderStatus.PENDING,
-        }
-        return status_map.get(status.lower(), OrderStatus.PENDING)
+        # API statuses are lowercase; only normalize on a miss
+        parsed = _STATUS_MAP.get(status)
+        if parsed is None:
+            parsed = _STATUS_MAP.get(status.lower(), OrderStatus.PENDING)
+        return parsed
 
     # === Positions ===
 
     async def get_positions(self) -> List[Position]:
         """Get all current positions."""
+        return await self._fetch_positions()
+
+    async def _fetch_positions(self, params: Optional[Dict[str, str]] = None) -> List[Position]:
+        """Fetch positions, optionally filtered server-side (e.g. by ticker)."""
         self._ensure_connected()
 
         path = "/portfolio/positions"
@@ -327,9 +440,9 @@ class KalshiExchange(BaseExchange):
         headers = self._get_headers("GET", path)
 
         try:
-            resp = await self._client.get(url, headers=headers)
+            resp = await self._client.get(url, headers=headers, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
             positions_data = data.get("market_positions", [])
 
             positions = []
@@ -350,13 +463,13 @@ class KalshiExchange(BaseExchange):
             return positions
 
         except Exception as e:
-            logger.error(f"Get positions error: {e}")
+            logger.error("Get positions error: %s", e)
             return []
 
     async def get_positions_by_market(self, market_id: str) -> List[Position]:
         """Get positions for a specific market."""
-        positions = await self.get_positions()
-        return [p for p in positions if p.market_id == market_id]
+        # Filter server-side instead of fetching every position
+        return await self._fetch_positions({"ticker": market_id})
 
     async def get_balance(self) -> Decimal:
         """Get available USD balance."""
@@ -369,14 +482,14 @@ class KalshiExchange(BaseExchange):
         try:
             resp = await self._client.get(url, headers=headers)
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
 
             # Balance in cents, convert to dollars
             balance_cents = data.get("balance", 0)
             return Decimal(str(balance_cents)) / 100
 
         except Exception as e:
-            logger.error(f"Get balance error: {e}")
+            logger.error("Get balance error: %s", e)
             return Decimal("0")
 
     # === Trade History ===
@@ -400,79 +513,122 @@ class KalshiExchange(BaseExchange):
         try:
             resp = await self._client.get(url, headers=headers, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = json.loads(resp.content)
             fills = data.get("fills", [])
 
-            trades = []
-            for fill in fills:
-                from datetime import datetime
-
-                created_at = fill.get("created_time", "")
-                try:
-                    timestamp = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                except ValueError:
-                    timestamp = datetime.now()
-
-                trades.append(
-                    Trade(
-                        trade_id=fill.get("trade_id", ""),
-                        timestamp=timestamp,
-                        token_id=fill.get("ticker", ""),
-                        side=OrderSide.BUY if fill.get("side") == "yes" else OrderSide.SELL,
-                        size=float(fill.get("count", 0)),
-                        price=float(fill.get("price", 0)) / 100,
-                        market_id=fill.get("ticker"),
-                    )
-                )
-
-            return trades
+            return [self._parse_fill(fill) for fill in fills]
 
         except Exception as e:
-            logger.error(f"Get trade history error: {e}")
+            logger.error("Get trade history error: %s", e)
             return []
 
-    # === Market Data ===
+    async def iter_trade_history(
+        self,
+        market_id: Optional[str] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Trade]:
+        """
+        Iterate historical trades, following pagination.
 
-    async def get_orderbook(self, token_id: str) -> Orderbook:
-        """Get current orderbook for a market."""
+        Holds one page in memory at a time; stop iterating to skip the
+        remaining pages.
+
+        Args:
+            market_id: Only trades for this market ticker
+            page_size: Fills per request
+        """
         self._ensure_connected()
 
-        path = f"/markets/{token_id}/orderbook"
-        url = f"{API_BASE}{path}"
-        headers = self._get_headers("GET", path)
+        params = {"limit": page_size}
+        if market_id:
+            params["ticker"] = market_id
 
         try:
-            resp = await self._client.get(url, headers=headers)
+            async for fill in self._iter_pages("/portfolio/fills", "fills", params):
+                yield self._parse_fill(fill)
+        except Exception as e:
+            logger.error("Get trade history error: %s", e)
+
+    def _parse_fill(self, fill: Dict) -> Trade:
+        """Convert an API fill to Trade."""
+        created_at = fill.get("created_time", "")
+        try:
+            timestamp = parse_timestamp(created_at)
+        except ValueError:
+            timestamp = datetime.now()
+
+        # OrderResult/Trade sizes are floats; `or 0` covers null fields
+        return Trade(
+            trade_id=fill.get("trade_id", ""),
+            timestamp=timestamp,
+            token_id=fill.get("ticker", ""),
+            side=OrderSide.BUY if fill.get("side") == "yes" else OrderSide.SELL,
+            size=float(fill.get("count") or 0),
+            price=(fill.get("price") or 0) / 100,
+            market_id=fill.get("ticker"),
+        )
+
+    async def _iter_pages(self, path: str, key: str, params: Dict) -> AsyncIterator[Dict]:
+        """Yield items from a cursor-paginated GET endpoint, one page at a time."""
+        url = f"{API_BASE}{path}"
+        params = dict(params)
+
+        while True:
+            headers = self._get_headers("GET", path)
+            resp = await self._client.get(url, headers=headers, params=params)
             resp.raise_for_status()
-            data = resp.json()
-            orderbook = data.get("orderbook", {})
+            data = json.loads(resp.content)
 
-            bids = []
-            asks = []
+            for item in data.get(key) or []:
+                yield item
 
-            # Kalshi orderbook has yes/no levels
-            # Convert to bids/asks format
-            yes_levels = orderbook.get("yes", [])
-            no_levels = orderbook.get("no", [])
+            cursor = data.get("cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
 
-            # YES bids (highest YES prices)
-            for level in yes_levels:
-                price_cents = level[0]
-                qty = level[1]
-                bids.append((price_cents / 100, qty))
+    # === Market Data ===
 
-            # YES asks derived from NO bids
-            for level in no_levels:
-                price_cents = level[0]
-                qty = level[1]
-                asks.append(((100 - price_cents) / 100, qty))
+    async def get_orderbook(self, token_id: str) -> Orderbook:
+        """Get current orderbook for a market."""
+        self._ensure_connected()
 
-            return Orderbook(token_id=token_id, bids=bids, asks=asks)
+        try:
+            data = await self._get_json_shared(f"/markets/{token_id}/orderbook")
+            return self._parse_orderbook(token_id, data.get("orderbook", {}))
 
         except Exception as e:
-            logger.error(f"Get orderbook error: {e}")
+            logger.error("Get orderbook error: %s", e)
             return Orderbook(token_id=token_id, bids=[], asks=[])
 
+    async def get_orderbooks(self, token_ids: List[str]) -> Dict[str, Orderbook]:
+        """
+        Get current orderbooks for several markets concurrently.
+
+        Args:
+            token_ids: Market tickers
+
+        Returns:
+            Dict mapping ticker -> Orderbook (empty book on error)
+        """
+        books = await asyncio.gather(*(self.get_orderbook(t) for t in token_ids))
+        return dict(zip(token_ids, books))
+
+    def _parse_orderbook(self, token_id: str, orderbook: Dict) -> Orderbook:
+        """Convert a Kalshi yes/no orderbook to bids/asks format."""
+        # Kalshi orderbook has yes/no [price_cents, qty] levels
+        # Convert to bids/asks format
+        yes_levels = orderbook.get("yes") or []
+        no_levels = orderbook.get("no") or []
+
+        # YES bids (highest YES prices)
+        bids = [(level[0] / 100, level[1]) for level in yes_levels]
+
+        # YES asks derived from NO bids
+        asks = [((100 - level[0]) / 100, level[1]) for level in no_levels]
+
+        return Orderbook(token_id=token_id, bids=bids, asks=asks)
+
     # === WebSocket Subscriptions ===
 
     async def subscribe_orderbook(
@@ -483,22 +639,38 @@ class KalshiExchange(BaseExchange):
         """
         Subscribe to orderbook updates.
 
+        The Orderbook passed to callback is reused for every update of the
+        same ticker (no per-tick allocation) - copy it if you need to keep
+        a snapshot.
+
         Note: Use OrderbookWebSocket directly for more control.
         """
         from pmkit.exchanges.kalshi.orderbook_ws import OrderbookWebSocket
 
+        books: Dict[str, Orderbook] = {}
+
         def wrap_callback(update):
-            orderbook = Orderbook(
-                token_id=update.market_ticker,
-                bids=[(update.yes_bid, update.yes_bid_size)] if update.yes_bid else [],
-                asks=[(update.yes_ask, update.yes_ask_size)] if update.yes_ask else [],
-            )
-            callback(update.market_ticker, orderbook)
+            ticker = update.market_ticker
+            orderbook = books.get(ticker)
+            if orderbook is None:
+                orderbook = books[ticker] = Orderbook(token_id=ticker, bids=[], asks=[])
+
+            bids = orderbook.bids
+            asks = orderbook.asks
+            bids.clear()
+            asks.clear()
+            if update.yes_bid:
+                bids.append((update.yes_bid, update.yes_bid_size))
+            if update.yes_ask:
+                asks.append((update.yes_ask, update.yes_ask_size))
+
+            callback(ticker, orderbook)
 
         self._orderbook_ws = OrderbookWebSocket(
             api_key_id=self.api_key_id,
             private_key_path=self.private_key_path,
             on_update=wrap_callback,
+            reuse_updates=True,  # wrap_callback copies fields out immediately
         )
         await self._orderbook_ws.connect(token_ids)
 
@@ -3,49 +3,194 @@
 Discovers current and next 15-minute crypto markets.
 """
 
+import asyncio
+import heapq
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 
+try:
+    import orjson as json  # Optional: pip install pmkit[speed]
+except ImportError:
+    import json
+
 from pmkit.exchanges.kalshi.types import (
     API_BASE,
     SERIES_TICKERS,
     SUPPORTED_ASSETS,
     KalshiMarket,
 )
+from pmkit.exchanges.utils import parse_timestamp, single_flight
 
 logger = logging.getLogger(__name__)
 
+MARKETS_CACHE_TTL = 2.0  # seconds to reuse a /markets response
+_CLOSE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"  # Kalshi's fixed-width UTC format
+
+
+def _soonest_open(markets_list: List[dict], now: datetime) -> List[Tuple[datetime, dict]]:
+    """
+    Pick the two soonest-closing markets that haven't closed yet.
+
+    Markets lacking a ticker/close time (or with an unparseable close
+    time) are dropped. Only current (0) and next (1) are ever used, so
+    there is no full sort.
+
+    Returns:
+        Up to two (close_time, market dict), soonest first
+    """
+    rows = [m for m in markets_list if m.get("ticker") and m.get("close_time")]
+
+    # Fixed-width UTC strings sort chronologically as text: rank them
+    # without parsing and only parse the two winners
+    now_str = now.strftime(_CLOSE_TIME_FORMAT)
+    width = len(now_str)
+    if all(len(m["close_time"]) == width and m["close_time"][-1] == "Z" for m in rows):
+        upcoming = (m for m in rows if m["close_time"] > now_str)
+        try:
+            return [
+                (parse_timestamp(m["close_time"]), m)
+                for m in heapq.nsmallest(2, upcoming, key=itemgetter("close_time"))
+            ]
+        except ValueError:
+            pass  # Malformed string - fall back to parsing every row
+
+    valid_markets = []
+    for m in rows:
+        try:
+            close_time = parse_timestamp(m["close_time"])
+        except ValueError:
+            continue
+
+        # Only consider markets that haven't closed
+        if close_time > now:
+            valid_markets.append((close_time, m))
+
+    return heapq.nsmallest(2, valid_markets, key=itemgetter(0))
+
 
 class MarketFinder:
     """
     Find 15-minute crypto markets on Kalshi.
 
     Usage:
-        finder = MarketFinder()
-        market = await finder.get_current_market("BTC")
-        markets = await finder.get_current_markets(["BTC", "ETH"])
+        async with MarketFinder() as finder:
+            market = await finder.get_current_market("BTC")
+            markets = await finder.get_current_markets(["BTC", "ETH"])
+
+    Inside `async with`, one HTTP/2 client is shared across calls
+    (keep-alive, no per-call TLS handshake) and closed on exit. Used
+    without the context manager, each request opens and closes its own
+    client, so nothing is left open if close() is never called.
     """
 
-    def __init__(self, timeout: float = 10.0):
+    def __init__(self, timeout: float = 10.0, cache_ttl: float = MARKETS_CACHE_TTL):
         """
         Initialize market finder.
 
         Args:
             timeout: HTTP request timeout in seconds
+            cache_ttl: Seconds to reuse market lookups per series (0 disables)
         """
         self.timeout = timeout
+        self._cache_ttl = cache_ttl
+        self._client: Optional[httpx.AsyncClient] = None
+        self._pooled = False  # Shared client only while a context owns it
+        self._markets_cache: Dict[str, Tuple[float, List[Tuple[datetime, KalshiMarket]]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "MarketFinder":
+        self._pooled = True
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        self._pooled = False
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     def _get_series_ticker(self, asset: str) -> Optional[str]:
         """Get series ticker for asset."""
         asset_upper = asset.upper()
         if asset_upper not in SERIES_TICKERS:
-            logger.error(f"Unsupported asset: {asset}. Supported: {SUPPORTED_ASSETS}")
+            logger.error("Unsupported asset: %s. Supported: %s", asset, SUPPORTED_ASSETS)
             return None
         return SERIES_TICKERS[asset_upper]
 
+    async def _get_open_markets(self, series_ticker: str) -> Optional[List[Tuple[datetime, KalshiMarket]]]:
+        """
+        Fetch the two soonest-closing open markets for a series.
+
+        Markets that have already closed (or lack a ticker/close time) are
+        dropped. Results are reused for cache_ttl seconds so repeated
+        current/next polls share one request; a cached entry whose current
+        market has closed is refetched so rollover is never delayed.
+        Concurrent misses for the same series share one in-flight request.
+
+        Returns:
+            Up to two (close_time, market), soonest first, or None on HTTP error
+        """
+        cached = self._markets_cache.get(series_ticker)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            markets = cached[1]
+            if not markets or markets[0][0] > datetime.now(timezone.utc):
+                return markets
+
+        return await single_flight(
+            self._inflight, series_ticker, lambda: self._fetch_open_markets(series_ticker)
+        )
+
+    async def _fetch_open_markets(self, series_ticker: str) -> Optional[List[Tuple[datetime, KalshiMarket]]]:
+        """Fetch and cache the two soonest-closing open markets for a series."""
+        now_mono = time.monotonic()
+        url = f"{API_BASE}/markets"
+        params = {
+            "series_ticker": series_ticker,
+            "status": "open",
+        }
+        if self._pooled:
+            response = await self._get_client().get(url, params=params)
+        else:
+            # No owner to close a shared client - use a short-lived one
+            async with httpx.AsyncClient(timeout=self.timeout) as client:
+                response = await client.get(url, params=params)
+
+        if response.status_code != 200:
+            logger.error("Failed to fetch markets: %s", response.status_code)
+            return None
+
+        data = json.loads(response.content)
+        markets_list = data.get("markets", [])
+
+        if not markets_list:
+            logger.debug("No open markets found for %s", series_ticker)
+
+        valid_markets = [
+            (close_time, KalshiMarket.from_api_response(m))
+            for close_time, m in _soonest_open(markets_list, datetime.now(timezone.utc))
+        ]
+
+        self._markets_cache[series_ticker] = (now_mono, valid_markets)
+        return valid_markets
+
     async def get_current_market(self, asset: str) -> Optional[KalshiMarket]:
         """
         Get current open 15-minute market for an asset.
@@ -63,63 +208,19 @@ class MarketFinder:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{API_BASE}/markets",
-                    params={
-                        "series_ticker": series_ticker,
-                        "status": "open",
-                    },
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch markets: {response.status_code}")
-                    return None
-
-                data = response.json()
-                markets_list = data.get("markets", [])
-
-                if not markets_list:
-                    logger.debug(f"No open markets found for {series_ticker}")
-                    return None
-
-                # Find market expiring soonest
-                now = datetime.now(timezone.utc)
-                earliest_market = None
-                earliest_close = None
-
-                for m in markets_list:
-                    ticker = m.get("ticker")
-                    close_time_str = m.get("close_time")
-
-                    if not ticker or not close_time_str:
-                        continue
-
-                    try:
-                        close_time = datetime.fromisoformat(
-                            close_time_str.replace("Z", "+00:00")
-                        )
-                    except ValueError:
-                        continue
-
-                    # Only consider markets that haven't closed
-                    if close_time <= now:
-                        continue
-
-                    if earliest_close is None or close_time < earliest_close:
-                        earliest_close = close_time
-                        earliest_market = KalshiMarket.from_api_response(m)
-
-                if earliest_market:
-                    logger.info(f"Found market: {earliest_market.ticker}")
+            valid_markets = await self._get_open_markets(series_ticker)
+            if not valid_markets:
+                return None
 
-                return earliest_market
+            market = valid_markets[0][1]
+            logger.info("Found market: %s", market.ticker)
+            return market
 
         except httpx.RequestError as e:
-            logger.error(f"Failed to fetch markets for {asset}: {e}")
+            logger.error("Failed to fetch markets for %s: %s", asset, e)
             return None
         except Exception as e:
-            logger.error(f"Error fetching market for {asset}: {e}")
+            logger.error("Error fetching market for %s: %s", asset, e)
             return None
 
     async def get_current_markets(
@@ -134,14 +235,17 @@ class MarketFinder:
         Returns:
             Dict mapping asset -> KalshiMarket
         """
-        markets = {}
-
-        for asset in assets:
-            market = await self.get_current_market(asset)
-            if market:
-                markets[asset.upper()] = market
-
-        return markets
+        # Independent requests - fetch concurrently over the shared client
+        results = await asyncio.gather(
+            *(self.get_current_market(asset) for asset in assets),
+            return_exceptions=True,
+        )
+
+        return {
+            asset.upper(): market
+            for asset, market in zip(assets, results)
+            if isinstance(market, KalshiMarket)
+        }
 
     async def get_next_market(self, asset: str) -> Optional[KalshiMarket]:
         """
@@ -160,49 +264,13 @@ class MarketFinder:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{API_BASE}/markets",
-                    params={
-                        "series_ticker": series_ticker,
-                        "status": "open",
-                    },
-                )
-
-                if response.status_code != 200:
-                    return None
-
-                data = response.json()
-                markets_list = data.get("markets", [])
-
-                if len(markets_list) < 2:
-                    return None
-
-                # Sort by close time and get second-soonest
-                now = datetime.now(timezone.utc)
-                valid_markets = []
-
-                for m in markets_list:
-                    close_time_str = m.get("close_time")
-                    if not close_time_str:
-                        continue
-
-                    try:
-                        close_time = datetime.fromisoformat(
-                            close_time_str.replace("Z", "+00:00")
-                        )
-                        if close_time > now:
-                            valid_markets.append((close_time, m))
-                    except ValueError:
-                        continue
-
-                valid_markets.sort(key=lambda x: x[0])
-
-                if len(valid_markets) >= 2:
-                    return KalshiMarket.from_api_response(valid_markets[1][1])
+            valid_markets = await self._get_open_markets(series_ticker)
 
-                return None
+            if valid_markets and len(valid_markets) >= 2:
+                return valid_markets[1][1]
+
+            return None
 
         except Exception as e:
-            logger.error(f"Error fetching next market for {asset}: {e}")
+            logger.error("Error fetching next market for %s: %s", asset, e)
             return None
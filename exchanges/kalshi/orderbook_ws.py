@@ -4,20 +4,38 @@ Real-time orderbook updates via WebSocket subscription.
 """
 
 import asyncio
-import json
+import inspect
 import logging
-from datetime import datetime, timezone
+import os
+import threading
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import websockets
 
+try:
+    import orjson as json  # Optional: pip install pmkit[speed]
+except ImportError:
+    import json
+
 from pmkit.exchanges.kalshi.auth import get_ws_auth_headers, load_private_key
 from pmkit.exchanges.kalshi.types import WS_URL, OrderbookUpdate
 from pmkit.exchanges.base import Orderbook
 
 logger = logging.getLogger(__name__)
 
+UPDATE_QUEUE_SIZE = 10_000  # pending async on_update calls before the oldest is dropped
+PRICE_LEVELS = 100  # Kalshi prices are integer cents 1-99; index 0 is unused
+_CENTS_TO_DECIMAL = [cents / 100 for cents in range(PRICE_LEVELS + 1)]
+_delta_fields = itemgetter("market_ticker", "side", "price", "delta")
+
+
+def _best_level(levels: List[int], below: int = PRICE_LEVELS) -> Optional[int]:
+    """Highest price under `below` with resting quantity, or None."""
+    return next((p for p in range(below - 1, 0, -1) if levels[p]), None)
+
 
 class OrderbookWebSocket:
     """
@@ -30,6 +48,9 @@ class OrderbookWebSocket:
         await ws.connect(market_tickers=["KXBTC15M-..."])
         # Use ws.get_prices(ticker) to get current prices
         await ws.close()
+
+    Use connect_in_thread() instead of connect() to ingest on a dedicated
+    thread, away from CPU-heavy strategy code on the main loop.
     """
 
     def __init__(
@@ -38,6 +59,7 @@ class OrderbookWebSocket:
         private_key_path: Union[str, Path],
         on_update: Optional[Callable[[OrderbookUpdate], Any]] = None,
         ticker_to_asset: Optional[Dict[str, str]] = None,
+        reuse_updates: bool = False,
     ):
         """
         Initialize orderbook WebSocket.
@@ -47,23 +69,50 @@ class OrderbookWebSocket:
             private_key_path: Path to RSA private key PEM file
             on_update: Callback for orderbook updates
             ticker_to_asset: Mapping of ticker -> asset (e.g., "KXBTC15M-..." -> "BTC")
+            reuse_updates: With a sync on_update, refill one OrderbookUpdate
+                per ticker instead of allocating one per update. The callback
+                must copy anything it keeps past its return. Ignored for
+                async callbacks.
         """
         self.api_key_id = api_key_id
         self.private_key = load_private_key(private_key_path)
         self._on_update = on_update
+        # Resolve the callback kind once instead of inspecting every result
+        self._on_update_async = inspect.iscoroutinefunction(on_update) or (
+            on_update is not None and inspect.iscoroutinefunction(getattr(on_update, "__call__", None))
+        )
         self.ticker_to_asset = ticker_to_asset or {}
 
+        # Reused OrderbookUpdate per ticker (sync callbacks only)
+        self._reuse_updates = reuse_updates and not self._on_update_async
+        self._update_buffers: Dict[str, OrderbookUpdate] = {}
+
         self._ws = None
         self._message_id = 1
         self._running = False
         self._task = None
 
-        # Orderbook state: ticker -> {yes: {price: qty}, no: {price: qty}}
-        self._orderbooks: Dict[str, dict] = {}
+        # Async on_update calls run in order on one emitter task
+        self._update_queue: asyncio.Queue = asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE)
+        self._emit_task = None
+
+        # Orderbook state, one entry (one hash lookup) per ticker:
+        # ticker -> ({yes: [qty by cent], no: [qty by cent]}, {yes: best cents, no: best cents})
+        # Best bids are kept in step with deltas.
+        self._orderbooks: Dict[str, Tuple[Dict[str, List[int]], Dict[str, Optional[int]]]] = {}
 
         # Best prices cache: ticker -> {yes_bid, yes_ask, no_bid, no_ask, ...}
         self._prices: Dict[str, dict] = {}
 
+        # Tickers changed since the last flush (see _mark_dirty)
+        self._dirty: Set[str] = set()
+        self._flush_scheduled = False
+
+        # Set by connect_in_thread()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread_stop: Optional[asyncio.Event] = None
+
     async def connect(self, market_tickers: List[str]) -> None:
         """
         Connect to WebSocket and subscribe to orderbook updates.
@@ -76,15 +125,71 @@ class OrderbookWebSocket:
 
         logger.info("Connecting to Kalshi WebSocket...")
 
-        self._ws = await websockets.connect(WS_URL, extra_headers=auth_headers)
+        self._ws = await websockets.connect(
+            WS_URL,
+            extra_headers=auth_headers,
+            compression=None,  # Small JSON frames - deflate costs more than it saves
+            max_size=2**18,  # One market's snapshot is a few KB at most
+            max_queue=256,  # Room to buffer a burst that _mark_dirty coalesces
+        )
         self._running = True
         logger.info("Connected to Kalshi WebSocket")
 
         # Subscribe to orderbook_delta channel
         await self._subscribe(market_tickers)
 
-        # Start message handler
+        # Start message handler and async-callback emitter
         self._task = asyncio.create_task(self._handle_messages())
+        if self._emit_task is None:
+            self._emit_task = asyncio.create_task(self._emit_updates())
+
+    def connect_in_thread(self, market_tickers: List[str], cpu: Optional[int] = None) -> None:
+        """
+        Connect and run the WebSocket on a dedicated thread and event loop.
+
+        Frame ingestion then can't be stalled by blocking or CPU-heavy code
+        on the caller's loop. on_update runs on the WebSocket thread - use
+        loop.call_soon_threadsafe to hand results back. The price getters
+        can be called from any thread. Stop with `await close()`.
+
+        Args:
+            market_tickers: List of market tickers to subscribe to
+            cpu: Pin the thread to this CPU core (Linux only, ignored elsewhere)
+        """
+        if self._thread is not None:
+            raise RuntimeError("Kalshi WebSocket thread already running")
+
+        self._thread_loop = asyncio.new_event_loop()
+        self._thread_stop = asyncio.Event()
+        self._thread = threading.Thread(
+            target=self._thread_main,
+            args=(market_tickers, cpu),
+            name="kalshi-orderbook-ws",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _thread_main(self, market_tickers: List[str], cpu: Optional[int]) -> None:
+        """Thread entry point: run connect() until close() is requested."""
+        if cpu is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {cpu})  # 0 = the calling thread on Linux
+
+        loop = self._thread_loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run_until_stopped(market_tickers))
+        except Exception as e:
+            logger.error(f"Kalshi WebSocket thread error: {e}")
+        finally:
+            loop.close()
+
+    async def _run_until_stopped(self, market_tickers: List[str]) -> None:
+        """Connect, then hold the thread's loop open until close()."""
+        try:
+            await self.connect(market_tickers)
+            await self._thread_stop.wait()
+        finally:
+            await self.close()
 
     async def _subscribe(self, market_tickers: List[str]) -> None:
         """Subscribe to orderbook_delta channel for given markets."""
@@ -98,7 +203,11 @@ class OrderbookWebSocket:
         }
         self._message_id += 1
 
-        await self._ws.send(json.dumps(msg))
+        payload = json.dumps(msg)
+        # orjson returns bytes - subscribe commands go out as text frames
+        if isinstance(payload, bytes):
+            payload = payload.decode()
+        await self._ws.send(payload)
         logger.info(f"Subscribed to orderbook_delta for {len(market_tickers)} markets")
 
     async def _handle_messages(self) -> None:
@@ -109,6 +218,7 @@ class OrderbookWebSocket:
                     break
 
                 try:
+                    # Accepts str or bytes frames; orjson skips the decode for bytes
                     data = json.loads(message)
                     await self._process_message(data)
                 except json.JSONDecodeError as e:
@@ -146,57 +256,96 @@ class OrderbookWebSocket:
         yes_levels = msg.get("yes", [])
         no_levels = msg.get("no", [])
 
-        self._orderbooks[ticker] = {
-            "yes": {level[0]: level[1] for level in yes_levels},
-            "no": {level[0]: level[1] for level in no_levels},
-        }
+        # Prices index straight into fixed-size per-side lists (no hashing)
+        yes_book = [0] * PRICE_LEVELS
+        no_book = [0] * PRICE_LEVELS
+        for book, levels in ((yes_book, yes_levels), (no_book, no_levels)):
+            for price, qty in levels:
+                if 0 < price < PRICE_LEVELS and qty > 0:
+                    book[price] = qty
+        # Full rescan only on snapshots - deltas maintain the best bids
+        best_bids = {"yes": _best_level(yes_book), "no": _best_level(no_book)}
+        self._orderbooks[ticker] = ({"yes": yes_book, "no": no_book}, best_bids)
 
-        self._update_best_prices(ticker)
+        self._mark_dirty(ticker)
 
     def _handle_delta(self, data: dict) -> None:
         """Handle orderbook_delta message - incremental update."""
-        msg = data.get("msg", {})
-        ticker = msg.get("market_ticker")
-        if not ticker:
+        # One C-level fetch of all four fields instead of four .get() calls
+        try:
+            ticker, side, price, delta = _delta_fields(data["msg"])
+        except (KeyError, TypeError):
             return
 
-        side = msg.get("side")
-        price = msg.get("price")
-        delta = msg.get("delta")
-
-        if side is None or price is None or delta is None:
+        if not ticker or side is None or price is None or delta is None:
+            return
+        if not 0 < price < PRICE_LEVELS:
             return
 
-        if ticker not in self._orderbooks:
-            self._orderbooks[ticker] = {"yes": {}, "no": {}}
+        state = self._orderbooks.get(ticker)
+        if state is None:
+            state = self._orderbooks[ticker] = (
+                {"yes": [0] * PRICE_LEVELS, "no": [0] * PRICE_LEVELS},
+                {"yes": None, "no": None},
+            )
+        books, best_bids = state
+
+        book = books[side]
+        new_qty = book[price] + delta
+        if new_qty < 0:
+            new_qty = 0
+        book[price] = new_qty
+
+        # A delta touches one level: the best only moves if that level is
+        # at or above it, and only needs a rescan (downward from the old
+        # best) if the best was emptied
+        best = best_bids[side]
+        if new_qty > 0:
+            if best is None or price > best:
+                best_bids[side] = price
+            elif price < best:
+                return  # Below the top - prices and sizes unchanged
+        elif price == best:
+            best_bids[side] = _best_level(book, price)
+        else:
+            return  # Emptied a level below the top
 
-        book = self._orderbooks[ticker][side]
-        current_qty = book.get(price, 0)
-        new_qty = current_qty + delta
+        self._mark_dirty(ticker)
 
-        if new_qty <= 0:
-            book.pop(price, None)
-        else:
-            book[price] = new_qty
+    def _mark_dirty(self, ticker: str) -> None:
+        """
+        Queue a best-price refresh for a ticker.
 
-        self._update_best_prices(ticker)
+        Frames already buffered by websockets are consumed without
+        yielding to the event loop, so the flush runs once the burst is
+        drained: N deltas to a ticker produce one update, not N.
+        """
+        self._dirty.add(ticker)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush_dirty)
+
+    def _flush_dirty(self) -> None:
+        """Refresh prices and emit one update per changed ticker."""
+        self._flush_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        for ticker in dirty:
+            try:
+                self._update_best_prices(ticker)
+            except Exception as e:
+                logger.error(f"Error processing message: {e}")
 
     def _update_best_prices(self, ticker: str) -> None:
         """Update best bid/ask prices for a ticker and emit update."""
-        book = self._orderbooks.get(ticker, {})
-        yes_book = book.get("yes", {})
-        no_book = book.get("no", {})
-
-        yes_bids = [p for p, q in yes_book.items() if q > 0]
-        no_bids = [p for p, q in no_book.items() if q > 0]
+        book, best_bids = self._orderbooks[ticker]
 
         # YES best bid (highest)
-        yes_bid = max(yes_bids) if yes_bids else None
-        yes_bid_size = yes_book.get(yes_bid, 0) if yes_bid else None
+        yes_bid = best_bids["yes"]
+        yes_bid_size = book["yes"][yes_bid] if yes_bid else None
 
         # NO best bid (highest)
-        no_bid = max(no_bids) if no_bids else None
-        no_bid_size = no_book.get(no_bid, 0) if no_bid else None
+        no_bid = best_bids["no"]
+        no_bid_size = book["no"][no_bid] if no_bid else None
 
         # Calculate asks from complementary side
         yes_ask = (100 - no_bid) if no_bid else None
@@ -204,40 +353,89 @@ class OrderbookWebSocket:
         no_ask = (100 - yes_bid) if yes_bid else None
         no_ask_size = yes_bid_size
 
-        # Store prices (convert cents to decimal)
+        # Convert cents to decimal once (table lookup); reused for the cache and the update
+        to_decimal = _CENTS_TO_DECIMAL
+        yes_bid_dec = to_decimal[yes_bid] if yes_bid else None
+        yes_ask_dec = to_decimal[yes_ask] if yes_ask else None
+        no_bid_dec = to_decimal[no_bid] if no_bid else None
+        no_ask_dec = to_decimal[no_ask] if no_ask else None
+
+        # Store prices
         self._prices[ticker] = {
-            "yes_bid": yes_bid / 100 if yes_bid else None,
+            "yes_bid": yes_bid_dec,
             "yes_bid_size": yes_bid_size,
-            "yes_ask": yes_ask / 100 if yes_ask else None,
+            "yes_ask": yes_ask_dec,
             "yes_ask_size": yes_ask_size,
-            "no_bid": no_bid / 100 if no_bid else None,
+            "no_bid": no_bid_dec,
             "no_bid_size": no_bid_size,
-            "no_ask": no_ask / 100 if no_ask else None,
+            "no_ask": no_ask_dec,
             "no_ask_size": no_ask_size,
         }
 
-        # Emit update callback
-        if self._on_update:
-            now = datetime.now(timezone.utc)
+        # Emit update callback. ticker_to_asset is public and may be swapped on
+        # rollover, so it is read here rather than bound once at connect.
+        on_update = self._on_update
+        if on_update:
             asset = self.ticker_to_asset.get(ticker, "UNKNOWN")
-
-            update = OrderbookUpdate(
-                timestamp_ms=int(now.timestamp() * 1000),
-                market_ticker=ticker,
-                asset=asset,
-                yes_bid=self._prices[ticker]["yes_bid"],
-                yes_bid_size=self._prices[ticker]["yes_bid_size"],
-                yes_ask=self._prices[ticker]["yes_ask"],
-                yes_ask_size=self._prices[ticker]["yes_ask_size"],
-                no_bid=self._prices[ticker]["no_bid"],
-                no_bid_size=self._prices[ticker]["no_bid_size"],
-                no_ask=self._prices[ticker]["no_ask"],
-                no_ask_size=self._prices[ticker]["no_ask_size"],
-            )
-
-            result = self._on_update(update)
-            if asyncio.iscoroutine(result):
-                asyncio.create_task(result)
+            timestamp_ms = time.time_ns() // 1_000_000
+
+            update = self._update_buffers.get(ticker) if self._reuse_updates else None
+            if update is None:
+                # Positional, in OrderbookUpdate field order
+                update = OrderbookUpdate(
+                    timestamp_ms,
+                    ticker,
+                    asset,
+                    yes_bid_dec,
+                    yes_bid_size,
+                    yes_ask_dec,
+                    yes_ask_size,
+                    no_bid_dec,
+                    no_bid_size,
+                    no_ask_dec,
+                    no_ask_size,
+                )
+                if self._reuse_updates:
+                    self._update_buffers[ticker] = update
+            else:
+                update.timestamp_ms = timestamp_ms
+                update.asset = asset
+                update.yes_bid = yes_bid_dec
+                update.yes_bid_size = yes_bid_size
+                update.yes_ask = yes_ask_dec
+                update.yes_ask_size = yes_ask_size
+                update.no_bid = no_bid_dec
+                update.no_bid_size = no_bid_size
+                update.no_ask = no_ask_dec
+                update.no_ask_size = no_ask_size
+
+            if self._on_update_async:
+                self._enqueue(on_update(update))
+            else:
+                result = on_update(update)
+                # Sync callables that hand back a coroutine (lambdas, wrappers)
+                if result is not None and asyncio.iscoroutine(result):
+                    # The coroutine holds this update - stop refilling it
+                    self._update_buffers.pop(ticker, None)
+                    self._enqueue(result)
+
+    def _enqueue(self, coro) -> None:
+        """Queue an on_update coroutine for the emitter, dropping the oldest if full."""
+        queue = self._update_queue
+        if queue.full():
+            queue.get_nowait().close()
+            logger.debug("on_update queue full - dropped oldest update")
+        queue.put_nowait(coro)
+
+    async def _emit_updates(self) -> None:
+        """Await queued on_update coroutines one at a time, in arrival order."""
+        queue = self._update_queue
+        while True:
+            coro = await queue.get()
+            try:
+                await coro
+            except Exception as e:
+                logger.error(f"on_update callback error: {e}")
 
     # Public getters
 
@@ -286,13 +484,31 @@ class OrderbookWebSocket:
 
     async def close(self) -> None:
         """Close WebSocket connection."""
+        # Threaded mode: the socket lives on the WebSocket thread's loop, so
+        # signal that thread to close it and wait for the thread to exit
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            self._thread = None
+            try:
+                self._thread_loop.call_soon_threadsafe(self._thread_stop.set)
+            except RuntimeError:
+                pass  # Thread already exited and closed its loop
+            await asyncio.to_thread(thread.join)
+            return
+
         self._running = False
         if self._ws:
             await self._ws.close()
             logger.info("Kalshi WebSocket closed")
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._emit_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._emit_task = None
+
+        # Close anything the emitter never reached
+        while not self._update_queue.empty():
+            self._update_queue.get_nowait().close()
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from pmkit.exchanges.utils import parse_timestamp
+
 # API endpoints
 API_BASE = "https://api.elections.kalshi.com/trade-api/v2"
 WS_URL = "wss://api.elections.kalshi.com/trade-api/ws/v2"
@@ -46,7 +48,7 @@ class KalshiMarket:
             KalshiMarket instance
         """
         close_time_str = data.get("close_time", "")
-        close_time = datetime.fromisoformat(close_time_str.replace("Z", "+00:00"))
+        close_time = parse_timestamp(close_time_str)
 
         return cls(
             ticker=data.get("ticker", ""),
@@ -72,7 +74,7 @@ class KalshiMarket:
         return self.status == "open" and self.get_seconds_remaining() > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderbookUpdate:
     """Orderbook update from WebSocket."""
 
@@ -1,17 +1,31 @@
 """Polymarket exchange client.
 
 Building blocks for trading on Polymarket prediction markets.
-Uses py-clob-client for order placement.
+Uses py-clob-client for order placement; its calls are synchronous, so
+they run in worker threads to keep the event loop free.
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
+import os
+import time
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 import httpx
 from eth_account import Account
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import MarketOrderArgs, OrderArgs, OrderType, TradeParams
+from py_clob_client.clob_types import ApiCreds, MarketOrderArgs, OrderArgs, OrderType, TradeParams
+
+try:
+    import orjson as json  # Optional: pip install pmkit[speed]
+except ImportError:
+    import json
 
 from pmkit.exchanges.base import (
     BaseExchange,
@@ -23,12 +37,31 @@ from pmkit.exchanges.base import (
     Position,
     Trade,
 )
+from pmkit.exchanges.utils import parse_timestamp, single_flight
 
 logger = logging.getLogger(__name__)
 
 CLOB_HOST = "https://clob.polymarket.com"
 DATA_API = "https://data-api.polymarket.com"
 
+POSITIONS_PAGE_SIZE = 500  # Data-API max rows per /positions page
+MAX_CONCURRENT_PAGES = 8  # in-flight /positions requests per get_positions()
+POSITIONS_CACHE_TTL = 1.0  # seconds get_positions_by_* reuse one snapshot
+
+# Pinned response schemas - rows missing a key take the loose path
+_position_fields = itemgetter(
+    "size", "asset", "avgPrice", "outcome", "conditionId",
+    "slug", "redeemable", "endDate", "currentValue",
+)
+_trade_fields = itemgetter("id", "asset_id", "side", "price", "size")
+
+_MIN_TIME = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _trade_sort_key(trade: Trade) -> datetime:
+    """Sort key for newest-first trade history (undated trades last)."""
+    return trade.timestamp or _MIN_TIME
+
 
 class PolymarketExchange(BaseExchange):
     """
@@ -58,6 +91,8 @@ class PolymarketExchange(BaseExchange):
         funder_address: str,
         chain_id: int = 137,
         host: str = CLOB_HOST,
+        positions_cache_ttl: float = POSITIONS_CACHE_TTL,
+        creds_cache_dir: Optional[Path] = None,
     ):
         """
         Initialize Polymarket client.
@@ -67,12 +102,25 @@ class PolymarketExchange(BaseExchange):
             funder_address: Polymarket Profile Address (where USDC is deposited)
             chain_id: 137 for Polygon mainnet, 80002 for Amoy testnet
             host: CLOB API host
+            positions_cache_ttl: Seconds get_positions_by_market/_by_token
+                reuse one positions snapshot (0 disables)
+            creds_cache_dir: Directory to persist derived API credentials in
+                (e.g. ~/.cache/pmkit/creds) so connect() skips derivation on
+                later runs. None (default) derives on every connect. Delete
+                the file if the key is revoked.
         """
         self.private_key = private_key
         self.funder_address = funder_address
         self.chain_id = chain_id
         self.host = host
         self._client: Optional[ClobClient] = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._positions_cache_ttl = positions_cache_ttl
+        # (fetched_at, by market id/slug, by token id)
+        self._positions_cache: Optional[Tuple[float, Dict[str, List[Position]], Dict[str, List[Position]]]] = None
+        self._positions_generation = 0  # bumped whenever positions may have changed
+        self._creds_cache_dir = Path(creds_cache_dir).expanduser() if creds_cache_dir else None
         self._api_creds = None
         self._initialized = False
 
@@ -92,8 +140,6 @@ class PolymarketExchange(BaseExchange):
             return
 
         try:
-            logger.info("Deriving API key from private key...")
-
             self._client = ClobClient(
                 host=self.host,
                 chain_id=self.chain_id,
@@ -102,7 +148,13 @@ class PolymarketExchange(BaseExchange):
                 signature_type=2,  # Magic/email-based logins
             )
 
-            self._api_creds = self._client.derive_api_key()
+            self._api_creds = self._load_cached_creds()
+            if self._api_creds is None:
+                logger.info("Deriving API key from private key...")
+                self._api_creds = await asyncio.to_thread(self._client.derive_api_key)
+                self._save_cached_creds(self._api_creds)
+            else:
+                logger.info("Using cached API credentials")
             self._client.set_api_creds(self._api_creds)
 
             self._initialized = True
@@ -112,8 +164,59 @@ class PolymarketExchange(BaseExchange):
             logger.error(f"Failed to connect: {e}")
             raise
 
+    def _creds_cache_file(self) -> Optional[Path]:
+        """Credentials file for this signer/funder/chain, if caching is enabled."""
+        if self._creds_cache_dir is None:
+            return None
+        key = f"{self.signer_address}:{self.funder_address}:{self.chain_id}".lower()
+        return self._creds_cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.json"
+
+    def _load_cached_creds(self) -> Optional[ApiCreds]:
+        """Load persisted API credentials; None if absent or unreadable."""
+        path = self._creds_cache_file()
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_bytes())
+            return ApiCreds(
+                api_key=data["api_key"],
+                api_secret=data["api_secret"],
+                api_passphrase=data["api_passphrase"],
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable credentials cache {path}: {e}")
+            return None
+
+    def _save_cached_creds(self, creds: ApiCreds) -> None:
+        """Persist API credentials (owner-only, atomic replace)."""
+        path = self._creds_cache_file()
+        if path is None:
+            return
+        payload = json.dumps({
+            "api_key": creds.api_key,
+            "api_secret": creds.api_secret,
+            "api_passphrase": creds.api_passphrase,
+        })
+        if isinstance(payload, str):  # stdlib json fallback
+            payload = payload.encode()
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                os.fchmod(f.fileno(), 0o600)
+                f.write(payload)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not persist API credentials to {path}: {e}")
+
     async def disconnect(self) -> None:
         """Close connections."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
         self._client = None
         self._api_creds = None
         self._initialized = False
@@ -124,6 +227,22 @@ class PolymarketExchange(BaseExchange):
         if not self._initialized:
             raise RuntimeError("Not connected. Call connect() first.")
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared Data-API client, creating it on first use."""
+        if self._http is None:
+            # One pooled HTTP/2 client - keep-alive, no per-call TLS handshake
+            self._http = httpx.AsyncClient(
+                base_url=DATA_API,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=40,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._http
+
     # === Orders ===
 
     async def place_limit_order(
@@ -155,9 +274,10 @@ class PolymarketExchange(BaseExchange):
         )
 
         try:
-            response = self._client.create_and_post_order(order_args)
+            response = await asyncio.to_thread(self._client.create_and_post_order, order_args)
 
             if response and "orderID" in response:
+                self._invalidate_positions()  # May have matched on placement
                 return OrderResult(
                     order_id=response["orderID"],
                     status=OrderStatus.OPEN,
@@ -179,6 +299,27 @@ class PolymarketExchange(BaseExchange):
                 message=str(e),
             )
 
+    async def place_limit_orders(
+        self,
+        orders: List[Tuple[str, OrderSide, float, float]],
+    ) -> List[OrderResult]:
+        """
+        Place several limit orders (GTC) concurrently.
+
+        Each order is signed and posted in a worker thread, so a basket
+        costs about one round-trip instead of one per order.
+
+        Args:
+            orders: (token_id, side, price, size) per order
+
+        Returns:
+            OrderResult per order, in input order
+        """
+        self._ensure_connected()
+        return list(await asyncio.gather(
+            *(self.place_limit_order(*order) for order in orders)
+        ))
+
     async def place_market_order(
         self,
         token_id: str,
@@ -205,10 +346,11 @@ class PolymarketExchange(BaseExchange):
         )
 
         try:
-            signed_order = self._client.create_market_order(order_args)
-            response = self._client.post_order(signed_order, OrderType.FAK)
+            signed_order = await asyncio.to_thread(self._client.create_market_order, order_args)
+            response = await asyncio.to_thread(self._client.post_order, signed_order, OrderType.FAK)
 
             if response and "orderID" in response:
+                self._invalidate_positions()
                 return OrderResult(
                     order_id=response["orderID"],
                     status=OrderStatus.FILLED,
@@ -248,7 +390,7 @@ class PolymarketExchange(BaseExchange):
         self._ensure_connected()
 
         try:
-            response = self._client.cancel(order_id)
+            response = await asyncio.to_thread(self._client.cancel, order_id)
             if response:
                 logger.info(f"Order cancelled: {order_id}")
                 return True
@@ -265,7 +407,7 @@ class PolymarketExchange(BaseExchange):
         self._ensure_connected()
 
         try:
-            response = self._client.cancel_all()
+            response = await asyncio.to_thread(self._client.cancel_all)
             if response:
                 logger.info("All orders cancelled")
                 return True
@@ -290,7 +432,7 @@ class PolymarketExchange(BaseExchange):
         self._ensure_connected()
 
         try:
-            orders = self._client.get_orders()
+            orders = await asyncio.to_thread(self._client.get_orders)
             for order in orders or []:
                 if order.get("id") == order_id:
                     status = self._parse_order_status(order.get("status", ""))
@@ -311,7 +453,7 @@ class PolymarketExchange(BaseExchange):
         self._ensure_connected()
 
         try:
-            orders = self._client.get_orders() or []
+            orders = await asyncio.to_thread(self._client.get_orders) or []
             results = []
 
             for order in orders:
@@ -343,69 +485,169 @@ class PolymarketExchange(BaseExchange):
 
     # === Positions ===
 
+    async def _get_positions_page(self, offset: int) -> Optional[list]:
+        """Fetch one /positions page; None on HTTP error or bad payload."""
+        response = await self._get_http().get(
+            "/positions",
+            params={"user": self.funder_address, "limit": POSITIONS_PAGE_SIZE, "offset": offset},
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Failed to fetch positions: {response.status_code}")
+            return None
+
+        data = json.loads(response.content)
+        if not isinstance(data, list):
+            return None
+        return data
+
+    def _parse_position(self, pos: Dict) -> Optional[Position]:
+        """Parse a Data-API position row; None for closed (size <= 0) rows."""
+        try:
+            (size, asset_id, avg_price, outcome, market_id,
+             slug, redeemable, end_date_str, current_value) = _position_fields(pos)
+        except KeyError:
+            return self._parse_position_loose(pos)
+
+        size = float(size)
+        if size <= 0:
+            return None
+        if not asset_id:
+            return self._parse_position_loose(pos)
+
+        end_date = None
+        if end_date_str:
+            try:
+                end_date = parse_timestamp(end_date_str)
+            except Exception:
+                pass
+
+        # Positional (Position field order) - keyword binding costs ~2x here
+        return Position(
+            asset_id,
+            size,
+            float(avg_price),
+            outcome.upper(),
+            market_id,
+            slug or pos.get("eventSlug"),
+            None,
+            redeemable is True or str(redeemable).lower() == "true",
+            end_date,
+            float(current_value),
+        )
+
+    def _parse_position_loose(self, pos: Dict) -> Optional[Position]:
+        """Parse a position row that doesn't match the pinned schema."""
+        size = float(pos.get("size", 0))
+        if size <= 0:
+            return None
+
+        asset_id = (
+            pos.get("asset")
+            or pos.get("assetId")
+            or pos.get("token_id")
+            or pos.get("tokenId")
+        )
+
+        # Parse end_date
+        end_date = None
+        end_date_str = pos.get("endDate")
+        if end_date_str:
+            try:
+                end_date = parse_timestamp(end_date_str)
+            except Exception:
+                pass
+
+        return Position(
+            token_id=asset_id or "",
+            size=size,
+            avg_price=float(pos.get("avgPrice", pos.get("avg_price", 0))),
+            side=pos.get("outcome", "").upper(),
+            market_id=pos.get("conditionId"),
+            market_slug=pos.get("slug") or pos.get("eventSlug"),
+            redeemable=str(pos.get("redeemable", "")).lower() == "true",
+            end_date=end_date,
+            current_value=float(pos.get("currentValue", 0)),
+        )
+
     async def get_positions(self) -> List[Position]:
-        """Get all current positions (paginated)."""
+        """
+        Get all current positions (paginated).
+
+        Concurrent callers share one fetch; each gets its own list.
+        """
+        key = ("positions", self._positions_generation)
+        return list(await single_flight(self._inflight, key, self._fetch_positions))
+
+    async def _fetch_positions(self) -> List[Position]:
+        """
+        Fetch all current positions.
+
+        The first page is fetched alone; if it is full, the following pages
+        are requested speculatively in concurrent rounds that double in
+        width (at most MAX_CONCURRENT_PAGES in flight) until one comes back
+        short. Requests past a short page are cancelled as soon as it lands.
+        """
         try:
-            from datetime import datetime
+            first = await self._get_positions_page(0)
+            pages = [first] if first else []
+
+            if first and len(first) == POSITIONS_PAGE_SIZE:
+                semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+                async def fetch_page(offset: int) -> Optional[list]:
+                    async with semaphore:
+                        return await self._get_positions_page(offset)
+
+                next_offset = POSITIONS_PAGE_SIZE
+                width = 2
+                done = False
+                while not done:
+                    tasks = [
+                        asyncio.ensure_future(fetch_page(next_offset + i * POSITIONS_PAGE_SIZE))
+                        for i in range(width)
+                    ]
+                    next_offset += width * POSITIONS_PAGE_SIZE
+                    width *= 2
+
+                    def cut_over(task: asyncio.Task, tasks: List[asyncio.Task] = tasks) -> None:
+                        # A short/failed page is the end - drop requests past it,
+                        # including ones still queued on the semaphore
+                        if task.cancelled() or task.exception() is not None:
+                            return
+                        data = task.result()
+                        if not data or len(data) < POSITIONS_PAGE_SIZE:
+                            for later in tasks[tasks.index(task) + 1:]:
+                                later.cancel()
+
+                    for task in tasks:
+                        task.add_done_callback(cut_over)
+                    try:
+                        batch = await asyncio.gather(*tasks, return_exceptions=True)
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+
+                    # Keep pages in order up to the first short/failed one;
+                    # only pages past it can have been cancelled
+                    for data in batch:
+                        if isinstance(data, asyncio.CancelledError):
+                            done = True  # Cut over - past the last page
+                            break
+                        if isinstance(data, Exception):
+                            raise data
+                        if data:
+                            pages.append(data)
+                        if not data or len(data) < POSITIONS_PAGE_SIZE:
+                            done = True
+                            break
 
             positions = []
-            offset = 0
-            page_size = 500
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                while True:
-                    response = await client.get(
-                        f"{DATA_API}/positions",
-                        params={"user": self.funder_address, "limit": page_size, "offset": offset},
-                    )
-
-                    if response.status_code != 200:
-                        logger.error(f"Failed to fetch positions: {response.status_code}")
-                        break
-
-                    data = response.json()
-                    if not data or not isinstance(data, list):
-                        break
-
-                    for pos in data:
-                        size = float(pos.get("size", 0))
-                        if size <= 0:
-                            continue
-
-                        asset_id = (
-                            pos.get("asset")
-                            or pos.get("assetId")
-                            or pos.get("token_id")
-                            or pos.get("tokenId")
-                        )
-
-                        # Parse end_date
-                        end_date = None
-                        end_date_str = pos.get("endDate")
-                        if end_date_str:
-                            try:
-                                end_date = datetime.fromisoformat(end_date_str)
-                            except Exception:
-                                pass
-
-                        positions.append(
-                            Position(
-                                token_id=asset_id or "",
-                                size=size,
-                                avg_price=float(pos.get("avgPrice", pos.get("avg_price", 0))),
-                                side=pos.get("outcome", "").upper(),
-                                market_id=pos.get("conditionId"),
-                                market_slug=pos.get("slug") or pos.get("eventSlug"),
-                                redeemable=str(pos.get("redeemable", "")).lower() == "true",
-                                end_date=end_date,
-                                current_value=float(pos.get("currentValue", 0)),
-                            )
-                        )
-
-                    # Check if we got less than a full page (no more data)
-                    if len(data) < page_size:
-                        break
-                    offset += page_size
+            for data in pages:
+                for pos in data:
+                    position = self._parse_position(pos)
+                    if position is not None:
+                        positions.append(position)
 
             return positions
 
@@ -413,48 +655,114 @@ class PolymarketExchange(BaseExchange):
             logger.error(f"Get positions error: {e}")
             return []
 
+    async def iter_positions(self) -> AsyncIterator[Position]:
+        """
+        Iterate all current positions, one page at a time.
+
+        Holds one page in memory at a time; stop iterating to skip the
+        remaining pages. Use get_positions() to fetch pages concurrently.
+        """
+        offset = 0
+        try:
+            while True:
+                data = await self._get_positions_page(offset)
+                if not data:
+                    return
+
+                for pos in data:
+                    position = self._parse_position(pos)
+                    if position is not None:
+                        yield position
+
+                if len(data) < POSITIONS_PAGE_SIZE:
+                    return
+                offset += POSITIONS_PAGE_SIZE
+        except Exception as e:
+            logger.error(f"Get positions error: {e}")
+
+    async def _get_positions_index(self) -> Tuple[Dict[str, List[Position]], Dict[str, List[Position]]]:
+        """
+        Positions indexed by market (condition ID and slug) and by token.
+
+        Rebuilt from a fresh fetch once the snapshot is positions_cache_ttl
+        seconds old, or after this client placed an order, redeemed, or
+        saw a fill on subscribe_fills(). Fills of resting orders are only
+        seen through subscribe_fills(); otherwise they show up within
+        positions_cache_ttl.
+        """
+        cached = self._positions_cache
+        if cached and time.monotonic() - cached[0] < self._positions_cache_ttl:
+            return cached[1], cached[2]
+
+        generation = self._positions_generation
+        fetched_at = time.monotonic()
+        positions = await single_flight(self._inflight, ("positions", generation), self._fetch_positions)
+
+        by_market: Dict[str, List[Position]] = {}
+        by_token: Dict[str, List[Position]] = {}
+        for p in positions:
+            by_token.setdefault(p.token_id, []).append(p)
+            if p.market_id:
+                by_market.setdefault(p.market_id, []).append(p)
+            if p.market_slug and p.market_slug != p.market_id:
+                by_market.setdefault(p.market_slug, []).append(p)
+
+        # Invalidated mid-fetch - the snapshot may predate the change
+        if generation == self._positions_generation:
+            self._positions_cache = (fetched_at, by_market, by_token)
+        return by_market, by_token
+
+    def _invalidate_positions(self) -> None:
+        """Drop the positions snapshot; fetches already in flight won't be cached."""
+        self._positions_generation += 1
+        self._positions_cache = None
+
     async def get_positions_by_market(self, market_id: str) -> List[Position]:
         """
         Get positions for a specific market.
 
+        Served from a positions snapshot up to positions_cache_ttl old.
+
         Args:
             market_id: Condition ID or slug
         """
-        positions = await self.get_positions()
-        return [
-            p
-            for p in positions
-            if p.market_id == market_id or p.market_slug == market_id
-        ]
+        by_market, _ = await self._get_positions_index()
+        return list(by_market.get(market_id, ()))
 
     async def get_positions_by_token(self, token_id: str) -> List[Position]:
         """
         Get positions for a specific token.
 
+        Served from a positions snapshot up to positions_cache_ttl old.
+
         Args:
             token_id: CLOB token ID
         """
-        positions = await self.get_positions()
-        return [p for p in positions if p.token_id == token_id]
+        _, by_token = await self._get_positions_index()
+        return list(by_token.get(token_id, ()))
 
     async def get_balance(self) -> Decimal:
-        """Get available USDC balance."""
+        """Get available USDC balance (concurrent callers share one request)."""
+        return await single_flight(self._inflight, ("balance",), self._fetch_balance)
+
+    async def _fetch_balance(self) -> Decimal:
+        """Fetch available USDC balance."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{DATA_API}/balance",
-                    params={"user": self.funder_address},
-                )
+            response = await self._get_http().get(
+                "/balance",
+                params={"user": self.funder_address},
+                timeout=10.0,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    if isinstance(data, dict) and "balance" in data:
-                        return Decimal(str(data["balance"]))
-                    elif isinstance(data, (int, float, str)):
-                        return Decimal(str(data))
+            if response.status_code == 200:
+                data = response.json()
+                if isinstance(data, dict) and "balance" in data:
+                    return Decimal(str(data["balance"]))
+                elif isinstance(data, (int, float, str)):
+                    return Decimal(str(data))
 
-                logger.debug("Balance endpoint not available")
-                return Decimal("0")
+            logger.debug("Balance endpoint not available")
+            return Decimal("0")
 
         except Exception as e:
             logger.error(f"Get balance error: {e}")
@@ -485,11 +793,9 @@ class PolymarketExchange(BaseExchange):
             else:
                 params = TradeParams(maker_address=self.funder_address)
 
-            raw_trades = self._client.get_trades(params) or []
+            raw_trades = await asyncio.to_thread(self._client.get_trades, params) or []
 
             # Parse all trades with timestamps
-            from datetime import datetime, timezone as tz
-
             trades = []
             for t in raw_trades:
                 # Parse timestamp (ISO format or unix timestamp)
@@ -498,32 +804,36 @@ class PolymarketExchange(BaseExchange):
                 if ts_str:
                     try:
                         if "T" in ts_str:
-                            if ts_str.endswith("Z"):
-                                ts_str = ts_str[:-1] + "+00:00"
-                            timestamp = datetime.fromisoformat(ts_str)
+                            timestamp = parse_timestamp(ts_str)
                         else:
                             # Unix timestamp fallback
-                            timestamp = datetime.fromtimestamp(float(ts_str), tz=tz.utc)
+                            timestamp = datetime.fromtimestamp(float(ts_str), tz=timezone.utc)
                     except Exception:
                         pass
 
+                try:
+                    trade_id, token_id, side, price, size = _trade_fields(t)
+                except KeyError:
+                    trade_id = t.get("id", t.get("trade_id", ""))
+                    token_id = t.get("asset_id", t.get("market", ""))
+                    side = t.get("side", "")
+                    price = t.get("price", 0)
+                    size = t.get("size", 0)
+
                 trades.append(
                     Trade(
-                        trade_id=t.get("id", t.get("trade_id", "")),
-                        token_id=t.get("asset_id", t.get("market", "")),
-                        side=t.get("side", "").upper(),
-                        price=float(t.get("price", 0)),
-                        size=float(t.get("size", 0)),
+                        trade_id=trade_id,
+                        token_id=token_id,
+                        side=side.upper(),
+                        price=float(price),
+                        size=float(size),
                         timestamp=timestamp,
                         outcome=t.get("outcome", ""),
                     )
                 )
 
-            # Sort by timestamp descending (newest first), then limit
-            min_time = datetime.min.replace(tzinfo=tz.utc)
-            trades.sort(key=lambda t: t.timestamp or min_time, reverse=True)
-
-            return trades[:limit]
+            # Newest first, then limit - only the top `limit` need ordering
+            return heapq.nlargest(limit, trades, key=_trade_sort_key)
 
         except Exception as e:
             logger.error(f"Get trade history error: {e}")
@@ -532,11 +842,50 @@ class PolymarketExchange(BaseExchange):
     # === Market Data ===
 
     async def get_orderbook(self, token_id: str) -> Orderbook:
-        """Get current orderbook for a token."""
+        """
+        Get current orderbook for a token (full depth, over REST).
+
+        Concurrent callers for the same token share one request and the
+        returned Orderbook (don't mutate it).
+        """
         self._ensure_connected()
+        return await single_flight(
+            self._inflight, ("orderbook", token_id), lambda: self._fetch_orderbook(token_id)
+        )
+
+    async def get_top_of_book(self, token_id: str) -> Orderbook:
+        """
+        Get the best bid and ask for a token (at most one level per side).
 
+        While subscribe_orderbook() is streaming this token and the sizes
+        at both best levels are known, the live book is returned without a
+        REST round-trip. Otherwise the REST book is fetched and reduced to
+        its best levels.
+        """
+        self._ensure_connected()
+
+        ws = getattr(self, "_orderbook_ws", None)
+        if ws is not None and ws.is_connected:
+            bid = ws.bids.get(token_id)
+            ask = ws.asks.get(token_id)
+            if (
+                (bid is not None or ask is not None)
+                and (bid is None or token_id in ws.bid_sizes)
+                and (ask is None or token_id in ws.ask_sizes)
+            ):
+                return ws.get_orderbook(token_id)
+
+        book = await self.get_orderbook(token_id)
+        return Orderbook(
+            token_id=token_id,
+            bids=[max(book.bids)] if book.bids else [],
+            asks=[min(book.asks)] if book.asks else [],
+        )
+
+    async def _fetch_orderbook(self, token_id: str) -> Orderbook:
+        """Fetch the full orderbook for a token over REST."""
         try:
-            book = self._client.get_order_book(token_id)
+            book = await asyncio.to_thread(self._client.get_order_book, token_id)
 
             bids = []
             asks = []
@@ -560,7 +909,7 @@ class PolymarketExchange(BaseExchange):
         self._ensure_connected()
 
         try:
-            midpoint = self._client.get_midpoint(token_id)
+            midpoint = await asyncio.to_thread(self._client.get_midpoint, token_id)
 
             if midpoint is None:
                 return None
@@ -587,6 +936,9 @@ class PolymarketExchange(BaseExchange):
         """
         Subscribe to orderbook updates.
 
+        While subscribed, get_top_of_book() for these tokens is served from
+        the stream instead of REST; get_orderbook() always fetches full depth.
+
         Note: Use OrderbookWebSocket directly for more control.
         """
         from pmkit.exchanges.polymarket.orderbook_ws import OrderbookWebSocket
@@ -609,6 +961,7 @@ class PolymarketExchange(BaseExchange):
         from pmkit.exchanges.polymarket.user_ws import UserWebSocket
 
         def wrap_callback(data: dict):
+            self._invalidate_positions()
             result = OrderResult(
                 order_id=data.get("id", ""),
                 status=OrderStatus.FILLED,
@@ -744,6 +1097,7 @@ class PolymarketExchange(BaseExchange):
             receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
 
             if receipt["status"] == 1:
+                self._invalidate_positions()
                 logger.info(f"Redeem successful: {tx_hash.hex()}")
                 return {
                     "success": True,
@@ -90,10 +90,12 @@ class OrderbookWebSocket(BaseWebSocket):
         best_bid = item.get("best_bid")
         best_ask = item.get("best_ask")
 
+        # price_change items carry the size of the level that changed; keep
+        # a best-level size only when it is known to belong to that level
         if best_bid:
-            self.bids[asset_id] = float(best_bid)
+            self._set_best(asset_id, float(best_bid), "BUY", item, self.bids, self.bid_sizes)
         if best_ask:
-            self.asks[asset_id] = float(best_ask)
+            self._set_best(asset_id, float(best_ask), "SELL", item, self.asks, self.ask_sizes)
 
         if self._on_update and (best_bid or best_ask):
             orderbook = self.get_orderbook(asset_id)
@@ -101,6 +103,22 @@ class OrderbookWebSocket(BaseWebSocket):
             if asyncio.iscoroutine(result):
                 await result
 
+    @staticmethod
+    def _set_best(
+        asset_id: str,
+        price: float,
+        side: str,
+        item: dict,
+        prices: Dict[str, float],
+        sizes: Dict[str, float],
+    ) -> None:
+        """Update a best price, dropping its size if it no longer applies."""
+        if item.get("side") == side and "size" in item and float(item.get("price") or -1) == price:
+            sizes[asset_id] = float(item["size"])
+        elif prices.get(asset_id) != price:
+            sizes.pop(asset_id, None)  # New best level - size unknown until a book/update
+        prices[asset_id] = price
+
     async def _process_book(self, data: dict) -> None:
         """Process a full book update."""
         asset_id = data.get("asset_id")
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from pmkit.exchanges.utils import parse_timestamp
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,7 +167,7 @@ class PolymarketMarket:
         try:
             from datetime import timezone
 
-            end_dt = datetime.fromisoformat(self.end_date_iso.replace("Z", "+00:00"))
+            end_dt = parse_timestamp(self.end_date_iso)
             now = datetime.now(timezone.utc)
             delta = (end_dt - now).total_seconds()
             return max(0, int(delta))
@@ -0,0 +1,42 @@
+"""Shared helpers for exchange clients."""
+
+import asyncio
+import sys
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+if sys.version_info >= (3, 11):
+    # 3.11+ fromisoformat accepts the "Z" suffix directly - no string copy
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(value: str) -> datetime:
+        """Parse an API ISO-8601 timestamp (e.g. "2026-01-06T17:45:00Z")."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+async def single_flight(
+    inflight: Dict[Hashable, asyncio.Task],
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Await fetch(), sharing the call with concurrent callers for key.
+
+    The first caller starts fetch() as a task in `inflight`; callers
+    arriving before it finishes await the same task. The entry is removed
+    when the task completes, so the next call fetches again. The result
+    is shared - don't mutate it.
+
+    Args:
+        inflight: Per-owner table of in-flight tasks
+        key: Identifies identical requests
+        fetch: Starts the request (called only by the first caller)
+    """
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shield so one caller being cancelled doesn't fail the others
+    return await asyncio.shield(task)